@@ -5,30 +5,76 @@ A full-featured TUI that provides access to all ES functionality in an intuitive
 """
 
 import os
+import re
 import sys
 import subprocess
+import tempfile
 import json
 import shlex
+import shutil
 import threading
 import time
-from typing import List, Dict, Any, Optional, Tuple
+import unicodedata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 import argparse
-import copy
+import atexit
+import codecs
+import csv
+import io
 
 
 import logging
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 try:
     import curses
     from curses import panel
     from curses import ascii as cascii
 
-    BACKSPACE_KEYS = {curses.KEY_BACKSPACE, 8, 127, cascii.BS, cascii.DEL}
-    ENTER_KEYS = {curses.KEY_ENTER, 10, 13}
-    DELETE_KEYS = {curses.KEY_DC, 330}  # many curses builds map KEY_DC to 330
+    # 8=Ctrl-H, 127=DEL
+    BACKSPACE_KEYS = frozenset({curses.KEY_BACKSPACE, 8, 127, cascii.BS, cascii.DEL})
+    ENTER_KEYS = frozenset({curses.KEY_ENTER, 10, 13})  # LF/CR
+    DELETE_KEYS = frozenset({curses.KEY_DC, 330})  # many builds map KEY_DC to 330
+    # Human-readable names for debug logging (see ESTUI._get_key_name)
+    _KEY_NAMES = {
+        curses.KEY_F1: "F1",
+        curses.KEY_F2: "F2",
+        curses.KEY_F3: "F3",
+        curses.KEY_F4: "F4",
+        curses.KEY_F5: "F5",
+        curses.KEY_F10: "F10",
+        curses.KEY_UP: "UP",
+        curses.KEY_DOWN: "DOWN",
+        curses.KEY_LEFT: "LEFT",
+        curses.KEY_RIGHT: "RIGHT",
+        curses.KEY_ENTER: "ENTER",
+        curses.KEY_BACKSPACE: "BACKSPACE",
+        curses.KEY_DC: "DELETE",
+        curses.KEY_HOME: "HOME",
+        curses.KEY_END: "END",
+        curses.KEY_PPAGE: "PAGE_UP",
+        curses.KEY_NPAGE: "PAGE_DOWN",
+        27: "ESC",
+        9: "TAB",
+        10: "ENTER",
+        13: "ENTER",
+        127: "BACKSPACE",
+        15: "Ctrl+O",
+        5: "Ctrl+E",
+        18: "Ctrl+R",
+        17: "Ctrl+Q",
+        8: "BACKSPACE",
+        330: "DELETE",
+    }
 except ImportError:
     print("Error: curses module not available. This TUI requires curses support.")
     sys.exit(1)
@@ -142,11 +188,34 @@ class FileTypeIcons:
 
     @classmethod
     def get_icon(cls, result, use_unicode: bool = True) -> str:
-        if getattr(result, "is_folder", False):
-            return cls.UNICODE["folder"] if use_unicode else cls.ASCII["folder"]
-        ext = os.path.splitext(getattr(result, "filename", ""))[1].lower()
-        table = cls.UNICODE if use_unicode else cls.ASCII
-        return table.get(ext, table["default"])
+        return _icon_for(
+            getattr(result, "filename", ""),
+            bool(getattr(result, "is_folder", False)),
+            use_unicode,
+        )
+
+
+_UNICODE_ICONS = FileTypeIcons.UNICODE
+_ASCII_ICONS = FileTypeIcons.ASCII
+# Interned so lookups with an interned extension (SearchResult.ext_lower,
+# _icon_for) resolve on identity
+_KNOWN_EXTS = frozenset(sys.intern(k) for k in _UNICODE_ICONS if k.startswith("."))
+
+
+@lru_cache(maxsize=512)
+def _icon_for_ext(ext: str, is_folder: bool, use_unicode: bool) -> str:
+    """Icon for a lowercased extension; few distinct keys, so redraws hit the cache."""
+    table = _UNICODE_ICONS if use_unicode else _ASCII_ICONS
+    if is_folder:
+        return table["folder"]
+    if ext not in _KNOWN_EXTS:
+        return table["default"]
+    return table[ext]
+
+
+def _icon_for(filename: str, is_folder: bool, use_unicode: bool) -> str:
+    ext = sys.intern(os.path.splitext(filename)[1].lower())
+    return _icon_for_ext(ext, is_folder, use_unicode)
 
 
 # --- PyExifTool integration ---
@@ -159,9 +228,169 @@ except Exception:
     HAVE_PYEXIFTOOL = False
     logging.warning("PyExifTool not available. Extended metadata will be disabled.")
 
+# One long-running exiftool process shared by every metadata lookup; the
+# lock serialises the UI thread and background prefetches on its pipe
+_ET = None
+_ET_LOCK = threading.Lock()
+
+
+def get_exiftool(executable: Optional[str] = None):
+    """Lazily start (once) and return the shared ExifToolHelper, or None."""
+    global _ET
+    if _ET is None and HAVE_PYEXIFTOOL:
+        # Configure PyExifTool for proper UTF-8 handling on Windows
+        kw = {
+            "encoding": "utf-8",  # Force UTF-8 encoding
+            "common_args": ["-charset", "utf8"],  # Tell ExifTool to output UTF-8
+        }
+        if executable:
+            kw["executable"] = executable
+        et = exiftool.ExifToolHelper(**kw)
+        et.run()
+        _ET = et
+    return _ET
+
+
+def _shutdown_exiftool():
+    global _ET
+    et, _ET = _ET, None
+    if et is not None:
+        try:
+            et.terminate()
+        except Exception:
+            pass
+
+
+atexit.register(_shutdown_exiftool)
+
+
+def get_metadata_batch(
+    paths: List[str], executable: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Metadata for all *paths* in a single round-trip to the shared exiftool."""
+    with _ET_LOCK:
+        et = get_exiftool(executable)
+        if et is None:
+            return []
+        try:
+            return et.get_metadata(paths)
+        except Exception:
+            # The process may be wedged after an error: respawn on next use
+            _shutdown_exiftool()
+            raise
+
+
+def _exif_value_str(v: Any) -> str:
+    """Flatten an exiftool JSON value to one display string."""
+    if isinstance(v, (list, tuple)):
+        return ", ".join(map(str, v))
+    if isinstance(v, dict):
+        return json.dumps(v, ensure_ascii=False)
+    return str(v)
+
+
+def _clip_cells(text: str, cells: int) -> str:
+    """Longest prefix of *text* that fits in *cells* terminal columns.
+
+    East Asian wide/fullwidth characters (CJK, most emoji) take two columns,
+    so slicing by characters alone can run past a dialog border.
+    """
+    if text.isascii():
+        return text[:cells]
+    used = 0
+    for i, ch in enumerate(text):
+        used += 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+        if used > cells:
+            return text[:i]
+    return text
+
+
 # ---------- Properties helpers (Windows-first) ----------
 import datetime as _dt
 
+_WIN = sys.platform.startswith("win")
+
+# Win32 bindings are resolved once at import; the helpers below just call them
+if _WIN:
+    import ctypes
+    import winreg
+    from ctypes import wintypes as wt
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    _PVOID_P = ctypes.POINTER(ctypes.c_void_p)
+
+    _GetFileAttributesW = _kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wt.LPCWSTR]
+    _GetFileAttributesW.restype = wt.DWORD
+
+    _GetCompressedFileSizeW = _kernel32.GetCompressedFileSizeW
+    _GetCompressedFileSizeW.argtypes = [wt.LPCWSTR, wt.LPDWORD]
+    _GetCompressedFileSizeW.restype = wt.DWORD
+
+    _LocalFree = _kernel32.LocalFree
+    _LocalFree.argtypes = [ctypes.c_void_p]
+    _LocalFree.restype = ctypes.c_void_p
+
+    _GetNamedSecurityInfoW = _advapi32.GetNamedSecurityInfoW
+    _GetNamedSecurityInfoW.argtypes = [
+        wt.LPCWSTR,
+        ctypes.c_int,
+        wt.DWORD,
+        _PVOID_P,
+        _PVOID_P,
+        _PVOID_P,
+        _PVOID_P,
+        _PVOID_P,
+    ]
+    _GetNamedSecurityInfoW.restype = wt.DWORD
+
+    _LookupAccountSidW = _advapi32.LookupAccountSidW
+    _LookupAccountSidW.argtypes = [
+        wt.LPCWSTR,
+        ctypes.c_void_p,
+        wt.LPWSTR,
+        wt.LPDWORD,
+        wt.LPWSTR,
+        wt.LPDWORD,
+        wt.LPDWORD,
+    ]
+    _LookupAccountSidW.restype = wt.BOOL
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+    _OpenClipboard = _user32.OpenClipboard
+    _OpenClipboard.argtypes = [wt.HWND]
+    _OpenClipboard.restype = wt.BOOL
+
+    _EmptyClipboard = _user32.EmptyClipboard
+    _EmptyClipboard.argtypes = []
+    _EmptyClipboard.restype = wt.BOOL
+
+    _SetClipboardData = _user32.SetClipboardData
+    _SetClipboardData.argtypes = [wt.UINT, wt.HANDLE]
+    _SetClipboardData.restype = wt.HANDLE
+
+    _CloseClipboard = _user32.CloseClipboard
+    _CloseClipboard.argtypes = []
+    _CloseClipboard.restype = wt.BOOL
+
+    _GlobalAlloc = _kernel32.GlobalAlloc
+    _GlobalAlloc.argtypes = [wt.UINT, ctypes.c_size_t]
+    _GlobalAlloc.restype = wt.HGLOBAL
+
+    _GlobalLock = _kernel32.GlobalLock
+    _GlobalLock.argtypes = [wt.HGLOBAL]
+    _GlobalLock.restype = wt.LPVOID
+
+    _GlobalUnlock = _kernel32.GlobalUnlock
+    _GlobalUnlock.argtypes = [wt.HGLOBAL]
+    _GlobalUnlock.restype = wt.BOOL
+
+    _GlobalFree = _kernel32.GlobalFree
+    _GlobalFree.argtypes = [wt.HGLOBAL]
+    _GlobalFree.restype = wt.HGLOBAL
+
 
 def _fmt_ts(ts: float) -> str:
     try:
@@ -171,26 +400,99 @@ def _fmt_ts(ts: float) -> str:
         return ""
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def _fmt_bytes(n: int) -> str:
     try:
-        for unit in ["B", "KB", "MB", "GB", "TB", "PB"]:
-            if n < 1024 or unit == "PB":
-                return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
-            n /= 1024.0
+        if n < 1024:
+            return f"{n:.0f} B"
+        # bit_length picks the 1024-power directly instead of dividing in a loop
+        i = min(5, (int(n).bit_length() - 1) // 10)
+        return f"{n / (1 << (10 * i)):.1f} {_BYTE_UNITS[i]}"
     except Exception:
         return str(n)
 
 
+def _windows_owner(path: str) -> str:
+    """Owner of *path* as DOMAIN\\User via GetNamedSecurityInfoW (no subprocess)."""
+    SE_FILE_OBJECT = 1
+    OWNER_SECURITY_INFORMATION = 0x00000001
+
+    owner_sid = ctypes.c_void_p()
+    sd = ctypes.c_void_p()
+    rc = _GetNamedSecurityInfoW(
+        path,
+        SE_FILE_OBJECT,
+        OWNER_SECURITY_INFORMATION,
+        ctypes.byref(owner_sid),
+        None,
+        None,
+        None,
+        ctypes.byref(sd),
+    )
+    if rc != 0:
+        return ""
+
+    try:
+        name = ctypes.create_unicode_buffer(256)
+        name_len = wt.DWORD(len(name))
+        domain = ctypes.create_unicode_buffer(256)
+        domain_len = wt.DWORD(len(domain))
+        sid_use = wt.DWORD(0)
+        if not _LookupAccountSidW(
+            None,
+            owner_sid,
+            name,
+            ctypes.byref(name_len),
+            domain,
+            ctypes.byref(domain_len),
+            ctypes.byref(sid_use),
+        ):
+            return ""
+        return f"{domain.value}\\{name.value}" if domain.value else name.value
+    finally:
+        # the security descriptor is allocated by the API and must be freed
+        _LocalFree(sd)
+
+
+@lru_cache(maxsize=1024)
+def _windows_file_info(path: str) -> Tuple[int, int, str, bool]:
+    """Raw attributes, size on disk, owner and MOTW flag for *path* in one pass."""
+    # Attributes
+    fa = _GetFileAttributesW(path)
+
+    # Size on disk (allocated/“compressed” size is what Explorer shows)
+    high = wt.DWORD(0)
+    low = _GetCompressedFileSizeW(path, ctypes.byref(high))
+    if low == 0xFFFFFFFF:
+        # failure → fall back to logical size
+        sz_on_disk = os.path.getsize(path) if os.path.isfile(path) else 0
+    else:
+        sz_on_disk = (high.value << 32) | low
+
+    # Owner
+    try:
+        owner = _windows_owner(path)
+    except Exception:
+        owner = ""
+
+    # MOTW / “blocked”? The Zone.Identifier stream exists iff its attributes
+    # resolve; directories never carry one
+    blocked = (
+        fa != 0xFFFFFFFF
+        and not fa & 0x0010
+        and _GetFileAttributesW(path + ":Zone.Identifier") != 0xFFFFFFFF
+    )
+
+    return fa, sz_on_disk, owner, blocked
+
+
 def _windows_get_attrs(path: str) -> Dict[str, str]:
-    import ctypes
-    from ctypes import wintypes as wt
+    fa, sz_on_disk, owner, blocked = _windows_file_info(path)
 
     attrs = {}
     # Attributes
-    GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
-    GetFileAttributesW.argtypes = [wt.LPCWSTR]
-    GetFileAttributesW.restype = wt.DWORD
-    fa = GetFileAttributesW(path)
     flags = []
     if fa != 0xFFFFFFFF:
         pairs = [
@@ -210,59 +512,20 @@ def _windows_get_attrs(path: str) -> Dict[str, str]:
             if fa & bit:
                 flags.append(name)
     attrs["attributes"] = " ".join(flags) if flags else ""
-
-    # Size on disk (allocated/“compressed” size is what Explorer shows)
-    GetCompressedFileSizeW = ctypes.windll.kernel32.GetCompressedFileSizeW
-    GetCompressedFileSizeW.argtypes = [wt.LPCWSTR, wt.LPDWORD]
-    GetCompressedFileSizeW.restype = wt.DWORD
-    high = wt.DWORD(0)
-    low = GetCompressedFileSizeW(path, ctypes.byref(high))
-    if low == 0xFFFFFFFF:
-        # failure → fall back to logical size
-        sz_on_disk = os.path.getsize(path) if os.path.isfile(path) else 0
-    else:
-        sz_on_disk = (high.value << 32) | low
     attrs["size_on_disk"] = sz_on_disk
 
     # Associated type & app
     attrs.update(_windows_assoc_info(path))
 
-    # Owner (PowerShell – no backslashes inside f-string expressions)
-    try:
-        # PowerShell single-quoted literal: escape single quotes by doubling them
-        ps_path = path.replace("'", "''")
-        ps_cmd = f"(Get-Acl -LiteralPath '{ps_path}').Owner"
-
-        r = subprocess.run(
-            ["powershell", "-NoProfile", "-Command", ps_cmd],
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-        owner = r.stdout.strip() or ""
-    except Exception:
-        owner = ""
     attrs["owner"] = owner
-
-    # MOTW / “blocked”?
-    blocked = False
-    try:
-        if os.path.isfile(path):
-            with open(path + ":Zone.Identifier", "r", encoding="utf-8") as f:
-                blocked = True
-    except Exception:
-        blocked = False
     attrs["blocked"] = "Yes" if blocked else "No"
 
     return attrs
 
 
-def _windows_assoc_info(path: str) -> Dict[str, str]:
-    """Best-effort file type description and associated open command."""
-    import winreg
-
-    info = {"type": "", "opens_with": ""}
-    ext = os.path.splitext(path)[1].lower()
+@lru_cache(maxsize=512)
+def _progid_for_ext(ext: str) -> str:
+    """ProgId associated with *ext* (UserChoice first, then HKCR default)."""
     progid = ""
 
     # UserChoice first
@@ -283,28 +546,49 @@ def _windows_assoc_info(path: str) -> Dict[str, str]:
         except Exception:
             pass
 
+    return progid
+
+
+@lru_cache(maxsize=512)
+def _assoc_for_progid(progid: str) -> Tuple[str, str]:
+    """(friendly type, open command executable) registered for *progid*."""
+    type_desc = ""
+    exe = ""
     # Type (friendly)
+    try:
+        with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, progid) as k:
+            value, _ = winreg.QueryValueEx(k, None)
+            type_desc = str(value)
+    except Exception:
+        pass
+    # Open command
+    try:
+        with winreg.OpenKey(
+            winreg.HKEY_CLASSES_ROOT, rf"{progid}\shell\open\command"
+        ) as k:
+            cmd, _ = winreg.QueryValueEx(k, None)
+            if cmd.startswith('"'):
+                exe = cmd.split('"')[1]
+            else:
+                exe = cmd.split(" ")[0]
+    except Exception:
+        pass
+    return type_desc, exe
+
+
+def _windows_assoc_info(path: str) -> Dict[str, str]:
+    """Best-effort file type description and associated open command.
+
+    Registry lookups are memoized per extension/ProgId; call
+    ``_progid_for_ext.cache_clear()`` / ``_assoc_for_progid.cache_clear()``
+    to pick up association changes.
+    """
+    info = {"type": "", "opens_with": ""}
+    ext = os.path.splitext(path)[1].lower()
+
+    progid = _progid_for_ext(ext)
     if progid:
-        try:
-            with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, progid) as k:
-                type_desc, _ = winreg.QueryValueEx(k, None)
-                info["type"] = str(type_desc)
-        except Exception:
-            pass
-        # Open command
-        try:
-            with winreg.OpenKey(
-                winreg.HKEY_CLASSES_ROOT, rf"{progid}\shell\open\command"
-            ) as k:
-                cmd, _ = winreg.QueryValueEx(k, None)
-                exe = ""
-                if cmd.startswith('"'):
-                    exe = cmd.split('"')[1]
-                else:
-                    exe = cmd.split(" ")[0]
-                info["opens_with"] = exe
-        except Exception:
-            pass
+        info["type"], info["opens_with"] = _assoc_for_progid(progid)
 
     # Last resort friendly type
     if not info["type"]:
@@ -328,7 +612,7 @@ def gather_file_properties(path: str) -> Dict[str, str]:
     d["Modified"] = _fmt_ts(st.st_mtime)
     d["Accessed"] = _fmt_ts(st.st_atime)
 
-    if sys.platform.startswith("win"):
+    if _WIN:
         w = _windows_get_attrs(path)
         if d.get("Size"):
             d["Size on disk"] = _fmt_bytes(w.get("size_on_disk", 0))
@@ -349,6 +633,15 @@ def gather_file_properties(path: str) -> Dict[str, str]:
     return d
 
 
+# Launchers must not write over the curses screen or die with our session
+_DETACHED = dict(
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+    start_new_session=True,
+)
+
+
 def open_with_default_app(path: str) -> bool:
     """Open a file/folder with the OS default application. Non-blocking."""
     try:
@@ -364,9 +657,9 @@ def open_with_default_app(path: str) -> bool:
             # On Windows, use os.startfile with proper path handling
             os.startfile(normalized_path)  # type: ignore[attr-defined]
         elif sys.platform == "darwin":
-            subprocess.Popen(["open", normalized_path])
+            subprocess.Popen(["open", normalized_path], **_DETACHED)
         else:
-            subprocess.Popen(["xdg-open", normalized_path])
+            subprocess.Popen(["xdg-open", normalized_path], **_DETACHED)
         logging.debug(f"Opened with default app: {normalized_path}")
         return True
     except Exception as e:
@@ -402,7 +695,11 @@ class OutputFormat(Enum):
     M3U8 = "m3u8"
 
 
-@dataclass
+# __slots__ on the hot dataclasses where supported (dataclass(slots=) is 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class SearchOptions:
     query: str = ""
     mode: SearchMode = SearchMode.NORMAL
@@ -432,7 +729,7 @@ class SearchOptions:
     use_unicode_icons: bool = True  # set False for ASCII fallback
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SearchResult:
     filename: str
     full_path: str
@@ -443,9 +740,47 @@ class SearchResult:
     attributes: str = ""
     extension: str = ""
     is_folder: bool = False
-
-
-@dataclass
+    # Lowercased sort keys, filled on first use by the properties below
+    _name_lower: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dir_lower: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _ext_lower: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Parent directory; the es.exe parser fills it from the path column
+    _parent: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def name_lower(self) -> str:
+        if self._name_lower is None:
+            self._name_lower = self.filename.lower()
+        return self._name_lower
+
+    @property
+    def parent(self) -> str:
+        if self._parent is None:
+            self._parent = os.path.dirname(self.full_path)
+        return self._parent
+
+    @property
+    def dir_lower(self) -> str:
+        if self._dir_lower is None:
+            self._dir_lower = self.parent.lower()
+        return self._dir_lower
+
+    @property
+    def ext_lower(self) -> str:
+        if self._ext_lower is None:
+            # Interned: results share a handful of extensions, and the icon
+            # table (_KNOWN_EXTS) and sort compares then match on identity
+            self._ext_lower = sys.intern(os.path.splitext(self.filename)[1].lower())
+        return self._ext_lower
+
+
+@dataclass(**_SLOTS)
 class AdvancedSearchOptions:
     """Dataclass to hold the state of the advanced search form."""
 
@@ -495,6 +830,10 @@ class AdvancedSearchOptions:
 
 class Colors:
     def __init__(self):
+        # Colour pairs are global curses state: initialize them only once
+        if _COLORS is not None:
+            self.__dict__.update(_COLORS.__dict__)
+            return
         try:
             curses.start_color()
             curses.use_default_colors()
@@ -570,12 +909,136 @@ class Colors:
             self.SELECTED = 0
 
 
+_COLORS: Optional[Colors] = None
+
+
+def get_colors() -> Colors:
+    """Shared Colors instance, created on first use after curses is up."""
+    global _COLORS
+    if _COLORS is None:
+        _COLORS = Colors()
+    return _COLORS
+
+
+@lru_cache(maxsize=4096)
+def _format_size_cached(size_format: int, size_bytes: int) -> str:
+    """Size column text; visible rows share few distinct sizes, so cache them."""
+    if size_format == 0:  # Auto
+        if size_bytes < 1024:
+            return f"{size_bytes} B"
+        elif size_bytes < 1024 * 1024:
+            return f"{size_bytes / 1024:.1f} KB"
+        elif size_bytes < 1024 * 1024 * 1024:
+            return f"{size_bytes / (1024 * 1024):.1f} MB"
+        else:
+            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    elif size_format == 1:  # Bytes
+        return f"{size_bytes:,}"
+    elif size_format == 2:  # KB
+        return f"{size_bytes / 1024:.1f}"
+    elif size_format == 3:  # MB
+        return f"{size_bytes / (1024 * 1024):.1f}"
+    else:
+        return str(size_bytes)
+
+
+# Ctrl+W in the search field: trailing word plus the blanks before it
+_PREV_WORD_RE = re.compile(r"\s*\w+\Z")
+
+# Table header that shows the sort arrow for each sortable field
+_SORT_HEADERS = {
+    SortMode.NAME: "Name",
+    SortMode.SIZE: "Size",
+    SortMode.DATE_MODIFIED: "Modified",
+    SortMode.EXTENSION: "Ext",
+    SortMode.PATH: "Path",
+}
+
+# Optional lines of the File Information dialog, shown when non-empty
+_PREVIEW_LABELS = ("Modified", "Created", "Attributes")
+_PREVIEW_FIELDS = attrgetter("date_modified", "date_created", "attributes")
+
+# Header column type -> sort mode; the icon column sorts by extension
+_COL_TO_SORT = {
+    "icon": SortMode.EXTENSION,
+    "name": SortMode.NAME,
+    "size": SortMode.SIZE,
+    "date_modified": SortMode.DATE_MODIFIED,
+    "extension": SortMode.EXTENSION,
+    "path": SortMode.PATH,
+}
+
+
+@lru_cache(maxsize=16)
+def _header_columns(
+    show_icons: bool, show_size: bool, show_date_modified: bool, show_extension: bool
+) -> tuple:
+    """(label, col_type) pairs for the header row, matching draw_results."""
+    columns = []
+    if show_icons:
+        columns.append(("", "icon"))
+    columns.append(("Name", "name"))
+    if show_size:
+        columns.append(("Size", "size"))
+    if show_date_modified:
+        columns.append(("Modified", "date_modified"))
+    if show_extension:
+        columns.append(("Ext", "extension"))
+    columns.append(("Path", "path"))
+    return tuple(columns)
+
+
+class ResultView:
+    """Column-wise (SoA) copy of the visible slice of the result list.
+
+    Rebuilt only when the viewport or the underlying list changes, so each
+    frame indexes plain lists instead of chasing SearchResult attributes.
+    """
+
+    __slots__ = (
+        "source",
+        "key",
+        "results",
+        "filenames",
+        "is_folder",
+        "sizes",
+        "dates",
+        "extensions",
+        "parents",
+    )
+
+    def __init__(self):
+        self.source = None  # held so its id() cannot be reused while cached
+        self.key = None
+        self.results: List[SearchResult] = []
+
+    def scroll_to(self, results: List[SearchResult], top: int, height: int):
+        key = (len(results), top, height)
+        if results is self.source and key == self.key:
+            return
+        self.source = results
+        self.key = key
+        window = results[top : top + max(0, height)]
+        self.results = window
+        self.filenames = [r.filename or "" for r in window]
+        self.is_folder = [r.is_folder for r in window]
+        self.sizes = [r.size for r in window]
+        self.dates = [r.date_modified or "" for r in window]
+        self.extensions = [r.extension or "" for r in window]
+        self.parents = [r.parent for r in window]
+
+
 class StatusBar:
     def __init__(self, stdscr, y: int):
         self.stdscr = stdscr
         self.y = y
         self.height, self.width = stdscr.getmaxyx()
 
+    def resize(self, height: int, width: int):
+        """Track a new terminal size (called on KEY_RESIZE only)."""
+        self.height, self.width = height, width
+        self.y = height - 1
+
     def update(self, message: str, color_attr=None):
         if color_attr is None:
             color_attr = curses.A_REVERSE
@@ -583,7 +1046,8 @@ class StatusBar:
         self.stdscr.move(self.y, 0)
         self.stdscr.clrtoeol()
         self.stdscr.addstr(self.y, 0, message[: self.width - 1], color_attr)
-        self.stdscr.refresh()
+        # Flushed together with the rest of the frame
+        self.stdscr.noutrefresh()
 
 
 class InputDialog:
@@ -592,7 +1056,60 @@ class InputDialog:
         self.title = title
         self.prompt = prompt
         self.value = initial_value
-        self.colors = Colors()
+        self.cursor_pos = len(initial_value)
+        self.colors = get_colors()
+
+        # key -> handler; handlers return _ACCEPT/_CANCEL to leave the dialog
+        self._keymap = {
+            27: self._cancel,  # ESC
+            curses.KEY_LEFT: self._left,
+            curses.KEY_RIGHT: self._right,
+            curses.KEY_HOME: self._home,
+            curses.KEY_END: self._end,
+            **{k: self._delete_forward for k in DELETE_KEYS},
+            **{k: self._backspace for k in BACKSPACE_KEYS},
+            **{k: self._accept for k in ENTER_KEYS},
+        }
+
+    _ACCEPT = "accept"
+    _CANCEL = "cancel"
+
+    def _cancel(self):
+        return self._CANCEL
+
+    def _accept(self):
+        return self._ACCEPT
+
+    def _backspace(self):
+        if self.cursor_pos > 0:
+            self.value = (
+                self.value[: self.cursor_pos - 1] + self.value[self.cursor_pos :]
+            )
+            self.cursor_pos -= 1
+
+    def _delete_forward(self):
+        if self.cursor_pos < len(self.value):
+            self.value = (
+                self.value[: self.cursor_pos] + self.value[self.cursor_pos + 1 :]
+            )
+
+    def _left(self):
+        self.cursor_pos = max(0, self.cursor_pos - 1)
+
+    def _right(self):
+        self.cursor_pos = min(len(self.value), self.cursor_pos + 1)
+
+    def _home(self):
+        self.cursor_pos = 0
+
+    def _end(self):
+        self.cursor_pos = len(self.value)
+
+    def _insert(self, text: str):
+        self.value = (
+            self.value[: self.cursor_pos] + text + self.value[self.cursor_pos :]
+        )
+        self.cursor_pos += len(text)
 
     def show(self) -> Optional[str]:
         try:
@@ -604,10 +1121,10 @@ class InputDialog:
 
             win = curses.newwin(dialog_h, dialog_w, y0, x0)
             win.keypad(True)
-            cursor_pos = len(self.value)
+            self.cursor_pos = min(self.cursor_pos, len(self.value))
 
             while True:
-                win.clear()
+                win.erase()
                 try:
                     win.box()
                 except Exception:
@@ -626,8 +1143,8 @@ class InputDialog:
                 safe_addstr(win, 3, field_x, " " * (field_w - 1), curses.A_REVERSE)
 
                 # clip display
-                if cursor_pos >= field_w - 1:
-                    start = cursor_pos - (field_w - 2)
+                if self.cursor_pos >= field_w - 1:
+                    start = self.cursor_pos - (field_w - 2)
                 else:
                     start = 0
                 shown = self.value[start : start + field_w - 1]
@@ -645,58 +1162,77 @@ class InputDialog:
                 )
 
                 # place cursor (avoid last column)
-                cx = field_x + min(cursor_pos - start, field_w - 2)
+                cx = field_x + min(self.cursor_pos - start, field_w - 2)
                 try:
                     win.move(3, cx)
                 except Exception:
                     pass
 
-                win.refresh()
+                win.noutrefresh()
+                curses.doupdate()
                 key = win.getch()
 
-                if key == 27:  # ESC
-                    return None
-                elif key in (curses.KEY_ENTER, 10, 13):
-                    return self.value
-                elif key in BACKSPACE_KEYS:
-                    if cursor_pos > 0:
-                        self.value = (
-                            self.value[: cursor_pos - 1] + self.value[cursor_pos:]
-                        )
-                        cursor_pos -= 1
-                elif key == curses.KEY_DC:
-                    if cursor_pos < len(self.value):
-                        self.value = (
-                            self.value[:cursor_pos] + self.value[cursor_pos + 1 :]
-                        )
-                elif key == curses.KEY_LEFT:
-                    cursor_pos = max(0, cursor_pos - 1)
-                elif key == curses.KEY_RIGHT:
-                    cursor_pos = min(len(self.value), cursor_pos + 1)
-                elif key == curses.KEY_HOME:
-                    cursor_pos = 0
-                elif key == curses.KEY_END:
-                    cursor_pos = len(self.value)
+                handler = self._keymap.get(key)
+                if handler is not None:
+                    action = handler()
+                    if action is self._CANCEL:
+                        return None
+                    if action is self._ACCEPT:
+                        return self.value
                 elif 32 <= key <= 126:
-                    self.value = (
-                        self.value[:cursor_pos] + chr(key) + self.value[cursor_pos:]
-                    )
-                    cursor_pos += 1
+                    # Pastes arrive as a burst: splice them in with one redraw
+                    self._insert(self._drain_printable(win, chr(key)))
         finally:
             try:
                 win.erase()
-                win.refresh()
+                win.noutrefresh()
                 self.stdscr.touchwin()
-                self.stdscr.refresh()
+                self.stdscr.noutrefresh()
             except Exception:
                 pass
 
+    @staticmethod
+    def _drain_printable(win, buf: str) -> str:
+        """Append already-queued printable keys to *buf* without blocking."""
+        win.nodelay(True)
+        try:
+            while True:
+                k = win.getch()
+                if k == -1:
+                    break
+                if not 32 <= k <= 126:
+                    curses.ungetch(k)
+                    break
+                buf += chr(k)
+        finally:
+            win.nodelay(False)
+        return buf
+
+
+# OptionsDialog item label -> SearchOptions attribute it toggles
+_BOOL_OPTION_MAP = {
+    "Show Size Column": "show_size",
+    "Show Date Modified": "show_date_modified",
+    "Show Date Created": "show_date_created",
+    "Show Attributes": "show_attributes",
+    "Files Only": "files_only",
+    "Folders Only": "folders_only",
+    "Match Diacritics": "match_diacritics",
+    "Highlight Results": "highlight",
+}
+
+# OptionsDialog item label -> (SearchOptions attribute, input prompt)
+_STRING_OPTION_MAP = {
+    "Path Filter": ("path_filter", "Enter path filter:"),
+    "Instance Name": ("instance_name", "Enter instance name:"),
+}
+
 
 class OptionsDialog:
     def __init__(self, stdscr, options: SearchOptions):
         self.stdscr = stdscr
         self.options = options
-        self.colors = Colors()
+        self.colors = get_colors()
         self.current_item = 0
 
         # Define option items
@@ -730,6 +1266,48 @@ class OptionsDialog:
             ("Size Format", self._get_size_format_text),
             ("Date Format", self._get_date_format_text),
         ]
+        # Labels never change; only the values do
+        self._prefixes = [f"{label:<20}: " for label, _ in self.items]
+        self._title = " Options "
+        self._footer = "↑↓: Navigate  Enter: Edit  Esc: Close"
+
+        # key -> handler; handlers return _CLOSE/_REPAINT or None
+        self._keymap = {
+            27: self._close,  # ESC
+            curses.KEY_UP: self._up,
+            curses.KEY_DOWN: self._down,
+            curses.KEY_RESIZE: self._resize,
+            **{k: self._edit for k in ENTER_KEYS},
+        }
+
+    _CLOSE = "close"
+    _REPAINT = "repaint"
+    _RESIZE = "resize"
+
+    # Title placeholder + spacer above the items; only used for sizing
+    _STATIC_TITLE_LINES = (" Search Options ", "")
+
+    def _close(self):
+        return self._CLOSE
+
+    def _resize(self):
+        return self._RESIZE
+
+    def _up(self):
+        self.current_item = max(0, self.current_item - 1)
+
+    def _down(self):
+        self.current_item = min(len(self.items) - 1, self.current_item + 1)
+
+    def _edit(self):
+        try:
+            self._edit_current_option()
+        except Exception:
+            logging.error("Error editing option", exc_info=True)
+        return self._REPAINT
+
+    def _render_items(self) -> List[str]:
+        return [p + value() for p, (_, value) in zip(self._prefixes, self.items)]
 
     def _get_search_mode_text(self):
         mode_names = {
@@ -778,19 +1356,17 @@ class OptionsDialog:
             logging.debug("OptionsDialog.show() called")
             H, W = self.stdscr.getmaxyx()
 
-            # Build the lines once so we can size the dialog safely
-            def render_lines():
-                return [
-                    " Search Options ",  # title placeholder
-                    "",  # spacer
-                    *[f"{label:<20}: {value()}" for (label, value) in self.items],
-                    "",
-                    "↑↓: Navigate  Enter: Edit  Esc: Close",
-                ]
-
-            lines = render_lines()
-            dialog_h = min(max(10, len(lines) + 2), max(8, H - 2))
-            dialog_w = min(max(48, max(len(s) for s in lines) + 4), max(28, W - 4))
+            # Size the dialog once; it only changes on KEY_RESIZE, which
+            # re-enters show()
+            items = self._render_items()
+            n_lines = len(self._STATIC_TITLE_LINES) + len(items) + 2
+            longest = max(
+                max(len(s) for s in self._STATIC_TITLE_LINES),
+                max(len(s) for s in items),
+                len(self._footer),
+            )
+            dialog_h = min(max(10, n_lines + 2), max(8, H - 2))
+            dialog_w = min(max(48, longest + 4), max(28, W - 4))
             y0 = (H - dialog_h) // 2
             x0 = (W - dialog_w) // 2
             logging.debug(f"Options dialog dims: {dialog_h}x{dialog_w} at ({y0},{x0})")
@@ -800,21 +1376,29 @@ class OptionsDialog:
 
             top_idx = 0
             visible_rows = dialog_h - 5  # border + title + footer
+            row_w = dialog_w - 4
 
-            while True:
-                win.clear()
-                try:
-                    win.box()
-                except Exception:
-                    pass
+            # Frame (box, title, footer) is static: draw it once
+            try:
+                win.box()
+            except Exception:
+                pass
 
-                # Title (centered)
-                title = " Options "
-                tx = max(1, (dialog_w - len(title)) // 2)
-                safe_addstr(win, 0, tx, title, getattr(self.colors, "HEADER", 0))
+            # Title (centered)
+            tx = max(1, (dialog_w - len(self._title)) // 2)
+            safe_addstr(win, 0, tx, self._title, getattr(self.colors, "HEADER", 0))
 
-                # Recompute lines each frame (values can change)
-                lines = [f"{label:<20}: {value()}" for (label, value) in self.items]
+            # Footer
+            safe_addstr(
+                win, dialog_h - 2, 2, self._footer, getattr(self.colors, "INFO", 0)
+            )
+
+            # Shadow buffer of (text, attr) per body row; only rows that differ
+            # from the last frame are re-emitted
+            shadow: List[Optional[Tuple[str, int]]] = [None] * visible_rows
+            resized = False
+
+            while True:
 
                 # Scroll window around current selection
                 if self.current_item < top_idx:
@@ -825,51 +1409,61 @@ class OptionsDialog:
                 # Body
                 for i in range(visible_rows):
                     idx = top_idx + i
-                    if idx >= len(lines):
-                        break
-                    attr = (
-                        getattr(self.colors, "SELECTED", 0)
-                        if idx == self.current_item
-                        else getattr(self.colors, "NORMAL", 0)
+                    if idx < len(items):
+                        attr = (
+                            getattr(self.colors, "SELECTED", 0)
+                            if idx == self.current_item
+                            else getattr(self.colors, "NORMAL", 0)
+                        )
+                        cell = (items[idx], attr)
+                    else:
+                        cell = ("", getattr(self.colors, "NORMAL", 0))
+                    if cell == shadow[i]:
+                        continue
+                    # blank the row first so a shorter value leaves no residue
+                    safe_addstr(
+                        win, 2 + i, 2, " " * row_w, getattr(self.colors, "NORMAL", 0)
                     )
-                    safe_addstr(win, 2 + i, 2, lines[idx], attr)
-
-                # Footer
-                footer = "↑↓: Navigate  Enter: Edit  Esc: Close"
-                safe_addstr(
-                    win, dialog_h - 2, 2, footer, getattr(self.colors, "INFO", 0)
-                )
+                    safe_addstr(win, 2 + i, 2, cell[0], cell[1])
+                    shadow[i] = cell
 
-                win.refresh()
+                win.noutrefresh()
+                curses.doupdate()
                 key = win.getch()
 
-                if key == 27:  # ESC
+                handler = self._keymap.get(key)
+                if handler is None:
+                    continue
+                action = handler()
+                if action is self._CLOSE:
                     break
-                elif key == curses.KEY_UP:
-                    self.current_item = max(0, self.current_item - 1)
-                elif key == curses.KEY_DOWN:
-                    self.current_item = min(len(self.items) - 1, self.current_item + 1)
-                elif key in (curses.KEY_ENTER, 10, 13):
-                    try:
-                        self._edit_current_option()
-                    except Exception:
-                        logging.error("Error editing option", exc_info=True)
+                if action is self._RESIZE:
+                    resized = True
+                    break
+                if action is self._REPAINT:
+                    # Values can change after an edit; dimensions cannot
+                    items = self._render_items()
+                    # A nested InputDialog repaints stdscr over us; our window
+                    # buffer is intact, so just force it to be re-sent
+                    win.touchwin()
 
             # Cleanup
             try:
                 win.erase()
-                win.refresh()
+                win.noutrefresh()
                 self.stdscr.touchwin()
-                self.stdscr.refresh()
+                self.stdscr.noutrefresh()
             except Exception:
                 pass
+            if resized:
+                return self.show()
             logging.debug("OptionsDialog.show() finished")
             return True
         except Exception:
             logging.error("OptionsDialog.show() fatal", exc_info=True)
             try:
                 self.stdscr.touchwin()
-                self.stdscr.refresh()
+                self.stdscr.noutrefresh()
             except Exception:
                 pass
             return False
@@ -885,18 +1479,9 @@ class OptionsDialog:
             self.options.sort_ascending = not self.options.sort_ascending
         elif item_name == "Max Results":
             self._edit_max_results()
-        elif item_name in [
-            "Show Size Column",
-            "Show Date Modified",
-            "Show Date Created",
-            "Show Attributes",
-            "Files Only",
-            "Folders Only",
-            "Match Diacritics",
-            "Highlight Results",
-        ]:
+        elif item_name in _BOOL_OPTION_MAP:
             self._toggle_boolean_option(item_name)
-        elif item_name in ["Path Filter", "Instance Name"]:
+        elif item_name in _STRING_OPTION_MAP:
             self._edit_string_option(item_name)
         elif item_name == "Size Format":
             self.options.size_format = (self.options.size_format + 1) % 4
@@ -925,29 +1510,13 @@ class OptionsDialog:
             self.options.max_results = int(result)
 
     def _toggle_boolean_option(self, option_name):
-        mapping = {
-            "Show Size Column": "show_size",
-            "Show Date Modified": "show_date_modified",
-            "Show Date Created": "show_date_created",
-            "Show Attributes": "show_attributes",
-            "Files Only": "files_only",
-            "Folders Only": "folders_only",
-            "Match Diacritics": "match_diacritics",
-            "Highlight Results": "highlight",
-        }
-
-        attr_name = mapping.get(option_name)
+        attr_name = _BOOL_OPTION_MAP.get(option_name)
         if attr_name:
             current_value = getattr(self.options, attr_name)
             setattr(self.options, attr_name, not current_value)
 
     def _edit_string_option(self, option_name):
-        mapping = {
-            "Path Filter": ("path_filter", "Enter path filter:"),
-            "Instance Name": ("instance_name", "Enter instance name:"),
-        }
-
-        attr_name, prompt = mapping.get(option_name, ("", ""))
+        attr_name, prompt = _STRING_OPTION_MAP.get(option_name, ("", ""))
         if attr_name:
             current_value = getattr(self.options, attr_name)
             dialog = InputDialog(self.stdscr, option_name, prompt, current_value)
@@ -959,7 +1528,7 @@ class OptionsDialog:
 class HelpDialog:
     def __init__(self, stdscr):
         self.stdscr = stdscr
-        self.colors = Colors()
+        self.colors = get_colors()
 
         self.help_text = [
             "ES TUI - Everything Search Text User Interface",
@@ -1000,12 +1569,22 @@ class HelpDialog:
             "",
             "Press any key to close help...",
         ]
+        # Row colours never change; classify once
+        self._help_rows = [(line, self._classify(line)) for line in self.help_text]
+        self._dialog_h_needed = len(self._help_rows) + 4
+
+    def _classify(self, line: str) -> int:
+        if line.startswith("  "):
+            return self.colors.INFO
+        if line.endswith(":"):
+            return self.colors.HIGHLIGHT
+        return self.colors.NORMAL
 
     def show(self):
         try:
             logging.debug("HelpDialog.show() called")
             H, W = self.stdscr.getmaxyx()
-            dialog_h = min(len(self.help_text) + 4, H - 2)
+            dialog_h = min(self._dialog_h_needed, H - 2)
             dialog_w = min(80, W - 4)
             start_y = (H - dialog_h) // 2
             start_x = (W - dialog_w) // 2
@@ -1016,7 +1595,7 @@ class HelpDialog:
 
             win = curses.newwin(dialog_h, dialog_w, start_y, start_x)
             win.keypad(True)
-            win.clear()
+            win.erase()
             win.box()
 
             # Title
@@ -1025,41 +1604,47 @@ class HelpDialog:
             safe_addstr(win, 0, title_x, title, self.colors.HEADER)
 
             # Body (use safe_addstr)
-            for i, line in enumerate(self.help_text):
+            for i, (line, attr) in enumerate(self._help_rows):
                 if i >= dialog_h - 3:
                     break
-                y = i + 2
-                if line.startswith("  "):
-                    safe_addstr(win, y, 2, line, self.colors.INFO)
-                elif line.endswith(":"):
-                    safe_addstr(win, y, 2, line, self.colors.HIGHLIGHT)
-                else:
-                    safe_addstr(win, y, 2, line, self.colors.NORMAL)
+                safe_addstr(win, i + 2, 2, line, attr)
 
-            win.refresh()
+            win.noutrefresh()
+            curses.doupdate()
             logging.debug("Help dialog displayed, waiting for key")
             _ = win.getch()
 
             # Clean up
             win.erase()
-            win.refresh()
+            win.noutrefresh()
             self.stdscr.touchwin()
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
             logging.debug("Help dialog cleanup complete")
 
         except Exception as e:
             logging.error(f"Error in HelpDialog.show(): {e}", exc_info=True)
             try:
                 self.stdscr.touchwin()
-                self.stdscr.refresh()
+                self.stdscr.noutrefresh()
             except:
                 pass
 
 
+# (ES date prefix, min getter, max getter) for AdvancedSearchDialog.build_query
+_DATE_FILTER_GETTERS = tuple(
+    (prefix, attrgetter(min_attr), attrgetter(max_attr))
+    for prefix, min_attr, max_attr in (
+        ("dc", "date_created_min", "date_created_max"),
+        ("dm", "date_modified_min", "date_modified_max"),
+        ("da", "date_accessed_min", "date_accessed_max"),
+    )
+)
+
+
 class AdvancedSearchDialog:
     def __init__(self, stdscr):
         self.stdscr = stdscr
-        self.colors = Colors()
+        self.colors = get_colors()
         self.options = AdvancedSearchOptions()
         self.current_field_idx = 0
         self.is_active = True
@@ -1134,26 +1719,50 @@ class AdvancedSearchDialog:
             ("Instance Name:", "instance_name", "text"),
         ]
 
+        # Navigable fields with their draw-time invariants precomputed:
+        # (orig_idx, attr_name, field_type, padded_label, hint)
+        self._nav_entries = [
+            (
+                i,
+                field[1],
+                field[2],
+                f"{field[0]:<25}",
+                field[3] if field[2] == "text" and len(field) > 3 else None,
+            )
+            for i, field in enumerate(self.fields)
+            if field[2] != "separator"
+        ]
+        # Neighbouring navigable field for each navigable field index
+        order = [entry[0] for entry in self._nav_entries]
+        self._field_idx_to_nav_pos = {idx: pos for pos, idx in enumerate(order)}
+        self._next_nav = dict(zip(order, order[1:]))
+        self._prev_nav = dict(zip(order[1:], order))
+        self._row_w = 0
+        self._max_val_width = 0
+        self._options_version = 0  # bumped whenever a field value changes
+
     def build_query(self) -> str:
         """Constructs a comprehensive es.exe query string from all fields."""
+        opts = self.options
         parts = []
 
         # Basic search text
-        if self.options.search_text.strip():
-            parts.append(self.options.search_text.strip())
+        search_text = opts.search_text.strip()
+        if search_text:
+            parts.append(search_text)
 
         # File type filters using ES syntax
-        if self.options.files_only:
+        if opts.files_only:
             parts.append("/a-d")
-        elif self.options.folders_only:
+        elif opts.folders_only:
             parts.append("/ad")
 
         # File extensions
-        if self.options.file_extensions.strip():
+        if opts.file_extensions.strip():
             exts = [
-                ext.strip()
-                for ext in self.options.file_extensions.split(",")
-                if ext.strip()
+                ext
+                for ext in (e.strip() for e in opts.file_extensions.split(","))
+                if ext
             ]
             if len(exts) == 1:
                 parts.append(f"*.{exts[0]}")
@@ -1163,91 +1772,90 @@ class AdvancedSearchDialog:
                 parts.append(f"({ext_query})")
 
         # Size filters
-        if self.options.size_min.strip():
-            parts.append(f"size:>={self.options.size_min}")
-        if self.options.size_max.strip():
-            parts.append(f"size:<={self.options.size_max}")
+        size_min = opts.size_min.strip()
+        size_max = opts.size_max.strip()
+        if size_min:
+            parts.append(f"size:>={size_min}")
+        if size_max:
+            parts.append(f"size:<={size_max}")
 
         # Date filters
-        date_filters = [
-            ("dc", "date_created_min", "date_created_max"),
-            ("dm", "date_modified_min", "date_modified_max"),
-            ("da", "date_accessed_min", "date_accessed_max"),
-        ]
-
-        for prefix, min_attr, max_attr in date_filters:
-            min_val = getattr(self.options, min_attr).strip()
-            max_val = getattr(self.options, max_attr).strip()
+        for prefix, get_min, get_max in _DATE_FILTER_GETTERS:
+            min_val = get_min(opts).strip()
+            max_val = get_max(opts).strip()
             if min_val:
                 parts.append(f"{prefix}:>={min_val}")
             if max_val:
                 parts.append(f"{prefix}:<={max_val}")
 
         # Path filters
-        if self.options.path_filter.strip():
-            parts.append(f'path:"{self.options.path_filter}"')
-        if self.options.parent_path_filter.strip():
-            parts.append(f'parent:"{self.options.parent_path_filter}"')
+        path_filter = opts.path_filter.strip()
+        parent_path_filter = opts.parent_path_filter.strip()
+        if path_filter:
+            parts.append(f'path:"{path_filter}"')
+        if parent_path_filter:
+            parts.append(f'parent:"{parent_path_filter}"')
 
         # Attributes
-        if self.options.attributes_include.strip():
-            parts.append(f"/a{self.options.attributes_include}")
-        if self.options.attributes_exclude.strip():
-            parts.append(f"/a-{self.options.attributes_exclude}")
+        attributes_include = opts.attributes_include.strip()
+        attributes_exclude = opts.attributes_exclude.strip()
+        if attributes_include:
+            parts.append(f"/a{attributes_include}")
+        if attributes_exclude:
+            parts.append(f"/a-{attributes_exclude}")
 
         return " ".join(parts) if parts else ""
 
     def build_command_args(self) -> List[str]:
         """Build the complete command line arguments for es.exe."""
+        opts = self.options
         args = []
 
         # Search mode
-        if self.options.search_mode == "regex":
+        if opts.search_mode == "regex":
             args.append("-regex")
-        elif self.options.search_mode == "case":
+        elif opts.search_mode == "case":
             args.append("-case")
-        elif self.options.search_mode == "whole-word":
+        elif opts.search_mode == "whole-word":
             args.append("-whole-word")
-        elif self.options.search_mode == "match-path":
+        elif opts.search_mode == "match-path":
             args.append("-match-path")
 
-        if self.options.match_diacritics:
+        if opts.match_diacritics:
             args.append("-diacritics")
 
         # Sort
-        if self.options.sort_field != "name":
-            args.extend(["-sort", self.options.sort_field])
-        if self.options.sort_order == "descending":
+        if opts.sort_field != "name":
+            args.extend(["-sort", opts.sort_field])
+        if opts.sort_order == "descending":
             args.append("-sort-descending")
 
-        # Limits
-        if self.options.max_results.strip() and self.options.max_results != "1000":
+        # Limits (int() tolerates surrounding whitespace, so no strip needed)
+        if opts.max_results != "1000":
             try:
-                max_res = int(self.options.max_results)
-                args.extend(["-max-results", str(max_res)])
+                args.extend(["-max-results", str(int(opts.max_results))])
             except ValueError:
                 pass
 
-        if self.options.offset.strip() and self.options.offset != "0":
+        if opts.offset != "0":
             try:
-                offset = int(self.options.offset)
-                args.extend(["-offset", str(offset)])
+                args.extend(["-offset", str(int(opts.offset))])
             except ValueError:
                 pass
 
         # Highlighting
-        if self.options.highlight_results:
+        if opts.highlight_results:
             args.append("-highlight")
 
         # Instance
-        if self.options.instance_name.strip():
-            args.extend(["-instance", self.options.instance_name])
+        if opts.instance_name.strip():
+            args.extend(["-instance", opts.instance_name])
 
         # Path filters (separate from search text)
-        if self.options.path_filter.strip():
-            args.extend(["-path", self.options.path_filter])
-        if self.options.parent_path_filter.strip():
-            args.extend(["-parent-path", self.options.parent_path_filter])
+        if opts.path_filter.strip():
+            args.extend(["-path", opts.path_filter])
+        if opts.parent_path_filter.strip():
+            args.extend(["-parent-path", opts.parent_path_filter])
 
         return args
 
@@ -1262,93 +1870,22 @@ class AdvancedSearchDialog:
         win = curses.newwin(dialog_h, dialog_w, y0, x0)
         win.keypad(True)
 
-        # Filter out separator fields for navigation
-        nav_fields = [
-            (i, field) for i, field in enumerate(self.fields) if field[2] != "separator"
-        ]
+        nav_fields = self._nav_entries
+        self._row_w = dialog_w - 4
+        self._max_val_width = dialog_w - 30
 
+        content_h = dialog_h - 4
+        last_state = None
         while self.is_active:
-            win.clear()
-            win.box()
-
-            # Title
-            title = " Advanced Search - ES Command Line Options "
-            tx = max(1, (dialog_w - len(title)) // 2)
-            safe_addstr(win, 0, tx, title, self.colors.HEADER)
-
-            # Calculate visible area
-            content_h = dialog_h - 4
-
-            # Auto-scroll to keep current field visible
-            current_nav_idx = next(
-                (
-                    i
-                    for i, (orig_idx, _) in enumerate(nav_fields)
-                    if orig_idx >= self.current_field_idx
-                ),
-                0,
-            )
-            if current_nav_idx < self.scroll_offset:
-                self.scroll_offset = current_nav_idx
-            elif current_nav_idx >= self.scroll_offset + content_h:
-                self.scroll_offset = current_nav_idx - content_h + 1
-
-            self.scroll_offset = max(
-                0, min(self.scroll_offset, len(nav_fields) - content_h)
-            )
-
-            # Draw fields
-            y = 2
-            for i in range(
-                self.scroll_offset, min(len(nav_fields), self.scroll_offset + content_h)
-            ):
-                if y >= dialog_h - 2:
-                    break
-
-                field_idx, field_info = nav_fields[i]
-                label, attr_name, field_type = field_info[:3]
-
-                # Skip separators in display
-                if field_type == "separator":
-                    continue
-
-                is_selected = field_idx == self.current_field_idx
-                attr = self.colors.SELECTED if is_selected else self.colors.NORMAL
-
-                # Draw label
-                safe_addstr(win, y, 2, f"{label:<25}", attr)
-
-                # Draw value based on field type
-                if field_type == "bool":
-                    value = getattr(self.options, attr_name)
-                    display_val = "[X]" if value else "[ ]"
-                elif field_type == "select":
-                    value = getattr(self.options, attr_name)
-                    options = field_info[3] if len(field_info) > 3 else []
-                    display_val = f"<{value}>"
-                else:  # text
-                    value = getattr(self.options, attr_name)
-                    display_val = str(value) if value else ""
-                    if len(field_info) > 3:  # has hint
-                        hint = field_info[3]
-                        if not display_val and not is_selected:
-                            display_val = f"({hint})"
-                            attr = self.colors.INFO
-
-                # Truncate if too long
-                max_val_width = dialog_w - 30
-                if len(display_val) > max_val_width:
-                    display_val = display_val[: max_val_width - 3] + "..."
-
-                safe_addstr(win, y, 27, display_val, attr)
-                y += 1
-
-            # Footer with instructions
-            footer = "↑↓:Navigate Enter:Edit Tab:Next F5:Search Esc:Cancel"
-            safe_addstr(win, dialog_h - 2, 2, footer[: dialog_w - 4], self.colors.INFO)
-
-            win.refresh()
+            # Full redraw only when something it depends on has changed
+            state = self._view_state()
+            if state != last_state:
+                self._draw_frame(win, nav_fields, dialog_h, dialog_w)
+                win.noutrefresh()
+                curses.doupdate()
+                last_state = self._view_state()  # _draw_frame may scroll
             key = win.getch()
+            moved = False
 
             if key == 27:  # ESC
                 self.is_active = False
@@ -1358,48 +1895,164 @@ class AdvancedSearchDialog:
                 self.is_active = False
                 return query
             elif key == curses.KEY_UP:
-                # Find previous non-separator field
-                for i in range(len(nav_fields) - 1, -1, -1):
-                    field_idx, field_info = nav_fields[i]
-                    if (
-                        field_idx < self.current_field_idx
-                        and field_info[2] != "separator"
-                    ):
-                        self.current_field_idx = field_idx
-                        break
+                prev_idx = self.current_field_idx
+                self.current_field_idx = self._prev_nav.get(prev_idx, prev_idx)
+                self._drain_moves(win)
+                moved = True
             elif key == curses.KEY_DOWN or key == ord("\t"):
-                # Find next non-separator field
-                for i in range(len(nav_fields)):
-                    field_idx, field_info = nav_fields[i]
-                    if (
-                        field_idx > self.current_field_idx
-                        and field_info[2] != "separator"
+                prev_idx = self.current_field_idx
+                self.current_field_idx = self._next_nav.get(prev_idx, prev_idx)
+                self._drain_moves(win)
+                moved = True
+            elif key in ENTER_KEYS:
+                self._edit_current_field()
+                # a nested InputDialog may have painted over us; if no value
+                # changed, re-sending our unchanged buffer is enough
+                win.touchwin()
+                win.noutrefresh()
+                curses.doupdate()
+
+            if moved and self.current_field_idx != prev_idx:
+                # Selection moved: repaint only the two affected rows unless
+                # the list has to scroll
+                old_offset = self.scroll_offset
+                self._scroll_into_view(nav_fields, content_h)
+                if self.scroll_offset == old_offset:
+                    for idx, selected in (
+                        (prev_idx, False),
+                        (self.current_field_idx, True),
                     ):
-                        self.current_field_idx = field_idx
-                        break
-            elif key in (curses.KEY_ENTER, 10, 13):
-                self._edit_current_field(nav_fields)
+                        pos = self._field_idx_to_nav_pos[idx]
+                        y = 2 + pos - self.scroll_offset
+                        self._draw_field(win, y, nav_fields[pos], selected)
+                    win.noutrefresh()
+                    curses.doupdate()
+                    last_state = self._view_state()
 
         # Cleanup
         try:
             win.erase()
-            win.refresh()
+            win.noutrefresh()
             self.stdscr.touchwin()
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
         except Exception:
             pass
         return None
 
-    def _edit_current_field(self, nav_fields):
-        """Edit the currently selected field."""
-        # Find current field info
-        current_field = None
-        for field_idx, field_info in nav_fields:
-            if field_idx == self.current_field_idx:
-                current_field = field_info
+    def _view_state(self):
+        """Everything the rendered form depends on."""
+        return (
+            self.stdscr.getmaxyx(),
+            self.current_field_idx,
+            self.scroll_offset,
+            self._options_version,
+        )
+
+    def _drain_moves(self, win):
+        """Apply any queued up/down keys before the next repaint.
+
+        A held arrow key queues repeats faster than we can draw; folding
+        them into one move means only the final position is rendered.
+        """
+        win.nodelay(True)
+        try:
+            while True:
+                key = win.getch()
+                if key == curses.KEY_UP:
+                    nav = self._prev_nav
+                elif key == curses.KEY_DOWN or key == ord("\t"):
+                    nav = self._next_nav
+                else:
+                    if key != -1:
+                        curses.ungetch(key)
+                    break
+                self.current_field_idx = nav.get(
+                    self.current_field_idx, self.current_field_idx
+                )
+        finally:
+            win.nodelay(False)
+
+    def _scroll_into_view(self, nav_fields, content_h):
+        """Adjust scroll_offset so the current field is visible."""
+        current_nav_idx = self._field_idx_to_nav_pos.get(self.current_field_idx, 0)
+        n_fields = len(nav_fields)
+        if current_nav_idx < self.scroll_offset:
+            self.scroll_offset = current_nav_idx
+        elif current_nav_idx >= self.scroll_offset + content_h:
+            self.scroll_offset = current_nav_idx - content_h + 1
+
+        self.scroll_offset = max(0, min(self.scroll_offset, n_fields - content_h))
+
+    def _draw_field(self, win, y, entry, is_selected):
+        """Draw one label/value row, padding it out to the full row width."""
+        _, attr_name, field_type, padded_label, hint = entry
+        attr = self.colors.SELECTED if is_selected else self.colors.NORMAL
+        val_attr = attr
+
+        # Draw value based on field type
+        if field_type == "bool":
+            value = getattr(self.options, attr_name)
+            display_val = "[X]" if value else "[ ]"
+        elif field_type == "select":
+            value = getattr(self.options, attr_name)
+            display_val = f"<{value}>"
+        else:  # text
+            value = getattr(self.options, attr_name)
+            display_val = str(value) if value else ""
+            if hint is not None and not display_val and not is_selected:
+                display_val = f"({hint})"
+                val_attr = self.colors.INFO
+
+        # Truncate if too long
+        max_val_width = self._max_val_width
+        if len(display_val) > max_val_width:
+            display_val = display_val[: max_val_width - 3] + "..."
+
+        # padded_label is 25 wide, so label + value land at x=2 and x=27
+        if val_attr == attr:
+            row = padded_label + display_val
+            safe_addstr(win, y, 2, row, attr)
+            # Blank the rest so a shorter value leaves no residue
+            safe_addstr(
+                win, y, 2 + len(row), " " * (self._row_w - len(row)), self.colors.NORMAL
+            )
+        else:
+            safe_addstr(win, y, 2, padded_label, attr)
+            safe_addstr(win, y, 27, display_val.ljust(self._row_w - 25), val_attr)
+
+    def _draw_frame(self, win, nav_fields, dialog_h, dialog_w):
+        """Render the whole form into win without flushing it."""
+        win.erase()
+        win.box()
+
+        # Title
+        title = " Advanced Search - ES Command Line Options "
+        tx = max(1, (dialog_w - len(title)) // 2)
+        safe_addstr(win, 0, tx, title, self.colors.HEADER)
+
+        # Calculate visible area
+        content_h = dialog_h - 4
+        self._scroll_into_view(nav_fields, content_h)
+
+        # Draw fields
+        y = 2
+        for i in range(
+            self.scroll_offset, min(len(nav_fields), self.scroll_offset + content_h)
+        ):
+            if y >= dialog_h - 2:
                 break
+            entry = nav_fields[i]
+            self._draw_field(win, y, entry, entry[0] == self.current_field_idx)
+            y += 1
 
-        if not current_field:
+        # Footer with instructions
+        footer = "↑↓:Navigate Enter:Edit Tab:Next F5:Search Esc:Cancel"
+        safe_addstr(win, dialog_h - 2, 2, footer[: dialog_w - 4], self.colors.INFO)
+
+    def _edit_current_field(self):
+        """Edit the currently selected field."""
+        current_field = self.fields[self.current_field_idx]
+        if current_field[2] == "separator":
             return
 
         label, attr_name, field_type = current_field[:3]
@@ -1407,6 +2060,7 @@ class AdvancedSearchDialog:
         if field_type == "bool":
             current_val = getattr(self.options, attr_name)
             setattr(self.options, attr_name, not current_val)
+            self._options_version += 1
         elif field_type == "select":
             options = current_field[3]
             current_val = getattr(self.options, attr_name)
@@ -1416,21 +2070,23 @@ class AdvancedSearchDialog:
                 setattr(self.options, attr_name, options[next_idx])
             except ValueError:
                 setattr(self.options, attr_name, options[0])
+            self._options_version += 1
         elif field_type == "text":
             current_val = getattr(self.options, attr_name)
             dialog = InputDialog(
                 self.stdscr, f"Edit {label}", f"Enter {label.lower()}:", current_val
             )
             result = dialog.show()
-            if result is not None:
+            if result is not None and result != current_val:
                 setattr(self.options, attr_name, result)
+                self._options_version += 1
 
 
 class ExportDialog:
     def __init__(self, stdscr, results: List[SearchResult]):
         self.stdscr = stdscr
         self.results = results
-        self.colors = Colors()
+        self.colors = get_colors()
         self.format = OutputFormat.CSV
         self.filename = ""
 
@@ -1442,13 +2098,12 @@ class ExportDialog:
         start_x = (width - dialog_width) // 2
 
         dialog_win = curses.newwin(dialog_height, dialog_width, start_y, start_x)
-        dialog_panel = panel.new_panel(dialog_win)
 
         formats = list(OutputFormat)
         current_format = 0
 
         while True:
-            dialog_win.clear()
+            dialog_win.erase()
             dialog_win.box()
 
             # Title
@@ -1469,7 +2124,7 @@ class ExportDialog:
             # Instructions
             dialog_win.addstr(8, 2, "↑↓: Select format | Enter: Export | Esc: Cancel")
 
-            panel.update_panels()
+            dialog_win.noutrefresh()
             curses.doupdate()
 
             key = dialog_win.getch()
@@ -1481,7 +2136,7 @@ class ExportDialog:
                 current_format = max(0, current_format - 1)
             elif key == curses.KEY_DOWN:
                 current_format = min(len(formats) - 1, current_format + 1)
-            elif key in (curses.KEY_ENTER, 10, 13):  # Enter
+            elif key in ENTER_KEYS:  # Enter
                 selected_format = formats[current_format]
 
                 # Get filename
@@ -1498,17 +2153,153 @@ class ExportDialog:
                     result = None
                     break
 
-        del dialog_panel
         del dialog_win
-        self.stdscr.clear()
-        self.stdscr.refresh()
+        self.stdscr.touchwin()  # the caller redraws the main screen
 
         return result
 
 
+# Query switches that mean the user already chose a setting we would
+# otherwise derive from SearchOptions
+_MODE_REGEX_SWITCHES = frozenset({"-regex", "-r"})
+_MODE_CASE_SWITCHES = frozenset({"-case", "-i"})
+_MODE_WHOLE_WORD_SWITCHES = frozenset({"-whole-word", "-w", "-ww"})
+_MODE_MATCH_PATH_SWITCHES = frozenset({"-match-path", "-p"})
+_DIACRITICS_SWITCHES = frozenset({"-diacritics", "-a"})
+_MAX_RESULTS_SWITCHES = frozenset({"-max-results", "-n"})
+_OFFSET_SWITCHES = frozenset({"-offset", "-o"})
+_FILE_FOLDER_SWITCHES = frozenset({"/ad", "/a-d"})
+
+# es.exe switches that consume the following token as their argument
+_ES_ARG_SWITCHES = frozenset(
+    {
+        "-sort",
+        "-max-results",
+        "-n",
+        "-offset",
+        "-o",
+        "-path",
+        "-parent-path",
+        "-instance",
+        "-size-format",
+        "-date-format",
+        "-timeout",
+    }
+)
+
+# SearchMode -> (es.exe switch, query switches that already request it)
+_MODE_FLAGS = {
+    SearchMode.REGEX: ("-regex", _MODE_REGEX_SWITCHES),
+    SearchMode.CASE_SENSITIVE: ("-case", _MODE_CASE_SWITCHES),
+    SearchMode.WHOLE_WORD: ("-whole-word", _MODE_WHOLE_WORD_SWITCHES),
+    SearchMode.MATCH_PATH: ("-match-path", _MODE_MATCH_PATH_SWITCHES),
+}
+
+# SortMode -> (ascending, descending) DIR-style sort switch
+_SORT_FLAGS = {
+    SortMode.NAME: ("/on", "/o-n"),
+    SortMode.SIZE: ("/os", "/o-s"),
+    SortMode.DATE_MODIFIED: ("/od", "/o-d"),
+    SortMode.EXTENSION: ("/oe", "/o-e"),
+}
+# Sorts without a DIR-style equivalent; passed as -sort <name>
+_SORT_NON_DIR = {
+    SortMode.PATH: "path",
+    SortMode.ATTRIBUTES: "attributes",
+}
+
+# Numeric sorts es.exe gets right whenever the column is in its output
+# (sort field -> SearchOptions flag); only text sorts need verifying
+_TRUSTED_ES_SORTS = {
+    SortMode.SIZE: "show_size",
+    SortMode.DATE_MODIFIED: "show_date_modified",
+}
+
+# Sort key for missing/unparseable dates
+_DATE_MIN = datetime.min
+
+
+@lru_cache(maxsize=8192)
+def _parse_es_date(date_str: str) -> datetime:
+    """Parse an es.exe date string; cached since listings repeat timestamps."""
+    if not date_str:
+        return _DATE_MIN
+
+    # es.exe emits a fixed "28/08/2025 13:05" layout: slice it directly
+    if len(date_str) == 16 and date_str[2] == "/" and date_str[13] == ":":
+        try:
+            return datetime(
+                int(date_str[6:10]),
+                int(date_str[3:5]),
+                int(date_str[0:2]),
+                int(date_str[11:13]),
+                int(date_str[14:16]),
+            )
+        except ValueError:
+            pass
+
+    try:
+        # Same layout with odd spacing/padding; strptime is more forgiving
+        return datetime.strptime(date_str, "%d/%m/%Y %H:%M")
+    except ValueError:
+        try:
+            # Fallback format
+            return datetime.strptime(date_str, "%d/%m/%Y")
+        except ValueError:
+            logging.debug(f"Could not parse date: {date_str}")
+            return _DATE_MIN
+
+
+# SortMode -> key function, shared by sort verification and the Python sort
+_SORT_KEYS = {
+    SortMode.NAME: attrgetter("name_lower"),
+    SortMode.SIZE: attrgetter("size"),
+    SortMode.DATE_MODIFIED: lambda r: _parse_es_date(r.date_modified),
+    SortMode.PATH: attrgetter("dir_lower"),
+    SortMode.EXTENSION: attrgetter("ext_lower"),
+}
+
+
+def _date_key(date_str: str) -> Tuple[str, ...]:
+    """Year-major string tuple for an es.exe date; orders like the datetime."""
+    if len(date_str) == 16 and date_str[2] == "/" and date_str[13] == ":":
+        # Fixed-width fields, so string order is numeric order
+        return (
+            date_str[6:10],
+            date_str[3:5],
+            date_str[0:2],
+            date_str[11:13],
+            date_str[14:16],
+        )
+    d = _parse_es_date(date_str) if date_str else _DATE_MIN
+    return (
+        f"{d.year:04d}",
+        f"{d.month:02d}",
+        f"{d.day:02d}",
+        f"{d.hour:02d}",
+        f"{d.minute:02d}",
+    )
+
+
+# Sort verification only needs ordering, so dates skip building datetimes
+_VERIFY_KEYS = {
+    **_SORT_KEYS,
+    SortMode.DATE_MODIFIED: lambda r: _date_key(r.date_modified),
+}
+
+
 class ESExecutor:
+    STREAM_BATCH = 200  # rows handed to the sink at a time
+
     def __init__(self, es_path: str = "es.exe"):
-        self.es_path = es_path
+        # es.exe has no persistent/stdin query mode, so every search is a
+        # fresh process; resolve it once so each launch skips the PATH walk
+        self.es_path = shutil.which(es_path) or es_path
+        # show_* bitmask -> column plan / column switches
+        self._plan_cache: Dict[int, Tuple[Tuple[str, str], ...]] = {}
+        self._columns_cache: Dict[int, Tuple[str, ...]] = {}
+        # Trusted sorts are still spot-checked once per session when debugging
+        self._trusted_sort_checked = False
 
     def build_command(self, options: SearchOptions) -> List[str]:
         cmd = [self.es_path]
@@ -1516,8 +2307,8 @@ class ESExecutor:
         # Parse the query string to extract DOS-style switches and search terms
         query_parts, dos_switches = self._parse_query_string(options.query)
 
-        logging.debug(f"Parsed query parts: {query_parts}")
-        logging.debug(f"Parsed DOS switches: {dos_switches}")
+        logger.debug("Parsed query parts: %s", query_parts)
+        logger.debug("Parsed DOS switches: %s", dos_switches)
 
         # Add search text (non-switch parts)
         if query_parts:
@@ -1525,6 +2316,7 @@ class ESExecutor:
 
         # Add DOS-style switches from query
         cmd.extend(dos_switches)
+        switches_set = frozenset(dos_switches)
 
         # Use DIR-style sorting for reliability (based on test results)
         has_sort_switch = any(
@@ -1532,96 +2324,46 @@ class ESExecutor:
         )
 
         if not has_sort_switch:
-            if options.sort_field == SortMode.NAME:
-                sort_flag = "/on" if options.sort_ascending else "/o-n"
-            elif options.sort_field == SortMode.SIZE:
-                sort_flag = "/os" if options.sort_ascending else "/o-s"
-            elif options.sort_field == SortMode.DATE_MODIFIED:
-                sort_flag = "/od" if options.sort_ascending else "/o-d"
-            elif options.sort_field == SortMode.EXTENSION:
-                sort_flag = "/oe" if options.sort_ascending else "/o-e"
-            elif options.sort_field == SortMode.PATH:
-                # Path doesn't have a DIR-style equivalent, use -sort syntax
-                cmd.extend(["-sort", "path"])
-                if not options.sort_ascending:
-                    cmd.extend(["-sort-descending"])
-                sort_flag = None
-            elif options.sort_field == SortMode.ATTRIBUTES:
-                cmd.extend(["-sort", "attributes"])
+            non_dir = _SORT_NON_DIR.get(options.sort_field)
+            if non_dir:
+                cmd.extend(["-sort", non_dir])
                 if not options.sort_ascending:
-                    cmd.extend(["-sort-descending"])
+                    cmd.append("-sort-descending")
                 sort_flag = None
             else:
-                # Default to name
-                sort_flag = "/on" if options.sort_ascending else "/o-n"
+                # Anything without a DIR-style flag defaults to name
+                pair = _SORT_FLAGS.get(options.sort_field, _SORT_FLAGS[SortMode.NAME])
+                sort_flag = pair[0 if options.sort_ascending else 1]
 
             if sort_flag:
                 cmd.append(sort_flag)
-                logging.debug(f"Using DIR-style sort: {sort_flag}")
+                logger.debug("Using DIR-style sort: %s", sort_flag)
 
         # Modes (but don't override if already specified in query)
-        if not any(sw in dos_switches for sw in ["-regex", "-r"]):
-            if options.mode == SearchMode.REGEX:
-                cmd.extend(["-regex"])
-
-        if not any(sw in dos_switches for sw in ["-case", "-i"]):
-            if options.mode == SearchMode.CASE_SENSITIVE:
-                cmd.extend(["-case"])
-
-        if not any(sw in dos_switches for sw in ["-whole-word", "-w", "-ww"]):
-            if options.mode == SearchMode.WHOLE_WORD:
-                cmd.extend(["-whole-word"])
-
-        if not any(sw in dos_switches for sw in ["-match-path", "-p"]):
-            if options.mode == SearchMode.MATCH_PATH:
-                cmd.extend(["-match-path"])
-
-        if (
-            options.match_diacritics
-            and "-diacritics" not in dos_switches
-            and "-a" not in dos_switches
-        ):
+        mode_flag = _MODE_FLAGS.get(options.mode)
+        if mode_flag and switches_set.isdisjoint(mode_flag[1]):
+            cmd.append(mode_flag[0])
+
+        if options.match_diacritics and switches_set.isdisjoint(_DIACRITICS_SWITCHES):
             cmd.extend(["-diacritics"])
 
         # Limits / offset
-        max_results_specified = any(
-            "-max-results" in str(sw) or "-n" in str(sw) for sw in dos_switches
-        )
+        max_results_specified = bool(switches_set & _MAX_RESULTS_SWITCHES)
         if options.max_results > 0 and not max_results_specified:
             cmd.extend(["-max-results", str(options.max_results)])
 
-        offset_specified = any(
-            "-offset" in str(sw) or "-o" in str(sw) for sw in dos_switches
-        )
+        offset_specified = bool(switches_set & _OFFSET_SWITCHES)
         if options.offset > 0 and not offset_specified:
             cmd.extend(["-offset", str(options.offset)])
 
         # Columns - always specify these for consistent output
-        columns = ["-name"]
-        if options.show_size:
-            columns.append("-size")
-        if options.show_date_modified:
-            columns.append("-date-modified")
-        if options.show_date_created:
-            columns.append("-date-created")
-        if options.show_date_accessed:
-            columns.append("-date-accessed")
-        if options.show_attributes:
-            columns.append("-attributes")
-        if options.show_extension:
-            columns.append("-extension")
-        columns.append("-path-column")  # directory only; we'll join with name
-        cmd.extend(columns)
+        cmd.extend(self._column_args(options))
 
         # Stable machine-readable output
         cmd.extend(["-csv", "-no-header"])
 
         # Filters (but don't duplicate file/folder filters from query)
-        has_file_folder_filter = any(
-            sw in dos_switches for sw in ["/ad", "/a-d"]
-        ) or any(
-            "files_only" in str(sw) or "folders_only" in str(sw) for sw in dos_switches
-        )
+        has_file_folder_filter = not switches_set.isdisjoint(_FILE_FOLDER_SWITCHES)
 
         if not has_file_folder_filter:
             if options.files_only:
@@ -1649,9 +2391,57 @@ class ESExecutor:
         if options.timeout > 0:
             cmd.extend(["-timeout", str(options.timeout)])
 
-        logging.debug(f"Final ES command: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final ES command: %s", " ".join(cmd))
         return cmd
 
+    @staticmethod
+    def _column_mask(options: SearchOptions) -> int:
+        return (
+            options.show_size
+            | options.show_date_modified << 1
+            | options.show_date_created << 2
+            | options.show_date_accessed << 3
+            | options.show_extension << 4
+        )
+
+    def _column_args(self, options: SearchOptions) -> Tuple[str, ...]:
+        """Column switches for build_command(), cached per show_* combination."""
+        mask = self._column_mask(options)
+        args = self._columns_cache.get(mask)
+        if args is None:
+            args = tuple(switch for switch, _ in self._column_plan(options))
+            self._columns_cache[mask] = args
+        return args
+
+    def _column_plan(self, options: SearchOptions) -> Tuple[Tuple[str, str], ...]:
+        """(es.exe column switch, SearchResult field) in the order ES emits them.
+
+        build_command() and _parse_output() both derive their column layout
+        from this, so the two can never disagree.
+        """
+        mask = self._column_mask(options)
+        cached = self._plan_cache.get(mask)
+        if cached is not None:
+            return cached
+
+        plan = [("-name", "filename")]
+        if options.show_size:
+            plan.append(("-size", "size"))
+        if options.show_date_modified:
+            plan.append(("-date-modified", "date_modified"))
+        if options.show_date_created:
+            plan.append(("-date-created", "date_created"))
+        if options.show_date_accessed:
+            plan.append(("-date-accessed", "date_accessed"))
+        # Always requested: the D bit tells folders apart without a stat()
+        plan.append(("-attributes", "attributes"))
+        if options.show_extension:
+            plan.append(("-extension", "extension"))
+        plan.append(("-path-column", "path"))  # directory only; joined with name
+        self._plan_cache[mask] = cached = tuple(plan)
+        return cached
+
     def _winsearch_script_path(self) -> str:
         """Absolute path to es_winsearch.py placed next to this TUI."""
         here = os.path.dirname(os.path.abspath(__file__))
@@ -1681,12 +2471,14 @@ class ESExecutor:
         Run es_winsearch.py (Windows Search content index) and parse rows into SearchResult.
         """
         cmd = self.build_command_winsearch(options)
-        logging.debug(
-            f"Executing WinSearch command: {' '.join(shlex.quote(x) for x in cmd)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Executing WinSearch command: %s",
+                " ".join(shlex.quote(x) for x in cmd),
+            )
 
         try:
-            r = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            r = subprocess.run(cmd, capture_output=True, timeout=60)
         except FileNotFoundError:
             return [], "es_winsearch.py not found next to es_tui.py"
         except subprocess.TimeoutExpired:
@@ -1695,21 +2487,24 @@ class ESExecutor:
             return [], f"Windows Search execution error: {e}"
 
         if r.returncode != 0:
-            err = r.stderr.strip() or f"exit code {r.returncode}"
+            err = r.stderr.decode(errors="replace").strip()
+            err = err or f"exit code {r.returncode}"
             return [], f"Windows Search failed: {err}"
 
-        # Reuse the same CSV parser used for es.exe output.
+        # Reuse the same CSV parser used for es.exe output; decoding happens
+        # in the TextIOWrapper, without an intermediate str copy.
         results = self._parse_output(r.stdout, options)
         return results, ""
 
     def execute_search_concat(
-        self, options: SearchOptions
+        self, options: SearchOptions, sink: Optional[List["SearchResult"]] = None
     ) -> Tuple[List["SearchResult"], str]:
         """
         Execute both: es.exe (filename/path DB) and es_winsearch.py (content index),
         then concatenate the result lists—no dedup, no cross-engine resorting.
+        es.exe rows are streamed into *sink* (if given) while they arrive.
         """
-        es_results, es_err = self.execute_search(options)
+        es_results, es_err = self.execute_search(options, sink)
         ws_results, ws_err = self.execute_search_winsearch(options)
 
         combined = es_results + ws_results
@@ -1738,30 +2533,20 @@ class ESExecutor:
         search_terms = []
         switches = []
 
+        n_tokens = len(tokens)
         i = 0
-        while i < len(tokens):
+        while i < n_tokens:
             token = tokens[i]
+            c = token[:1]
 
             # DOS-style switches
-            if token.startswith("/"):
+            if c == "/":
                 switches.append(token)
             # Unix-style switches
-            elif token.startswith("-"):
+            elif c == "-":
                 switches.append(token)
                 # Check if this switch takes an argument
-                if token in [
-                    "-sort",
-                    "-max-results",
-                    "-n",
-                    "-offset",
-                    "-o",
-                    "-path",
-                    "-parent-path",
-                    "-instance",
-                    "-size-format",
-                    "-date-format",
-                    "-timeout",
-                ] and i + 1 < len(tokens):
+                if token in _ES_ARG_SWITCHES and i + 1 < n_tokens:
                     i += 1
                     switches.append(tokens[i])
             else:
@@ -1771,32 +2556,94 @@ class ESExecutor:
 
         return search_terms, switches
 
-    def execute_search(self, options: SearchOptions) -> Tuple[List[SearchResult], str]:
+    def execute_search(
+        self, options: SearchOptions, sink: Optional[List[SearchResult]] = None
+    ) -> Tuple[List[SearchResult], str]:
+        """Run es.exe and parse its CSV output as it streams in.
+
+        If *sink* is given, each parsed row is appended to it as soon as it
+        arrives so the UI can render the first screenful before es.exe exits.
+        """
         # First try ES sorting
         cmd = self.build_command(options)
 
-        logging.debug(f"Executing ES command: {' '.join(cmd)}")
-        logging.debug(f"Query string: '{options.query}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing ES command: %s", " ".join(cmd))
+        logger.debug("Query string: '%s'", options.query)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # stderr goes to a file, not a pipe: a pipe is only read after
+            # stdout ends, so a chatty es.exe could fill it and stall
+            err_file = tempfile.TemporaryFile()
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=err_file,
+                    bufsize=1 << 20,
+                )
+            except BaseException:
+                err_file.close()
+                raise
 
-            logging.debug(f"ES process completed with return code: {result.returncode}")
+            # Same 30 s budget as before: kill es.exe if it overruns
+            expired = threading.Event()
 
-            if result.returncode != 0:
-                error_msg = f"ES returned error code {result.returncode}"
-                if result.stderr:
-                    error_msg += f": {result.stderr.strip()}"
+            def _expire():
+                expired.set()
+                proc.kill()
+
+            timer = threading.Timer(30, _expire)
+            timer.start()
+            try:
+                results = sink if sink is not None else []
+                stream = io.TextIOWrapper(proc.stdout, newline="")
+                rows = self._iter_results(stream, options)
+                limit = self._row_limit(cmd)
+                if limit is not None:
+                    rows = islice(rows, limit)
+                # Publish in batches so the UI thread sees whole chunks
+                # rather than a list growing one row at a time under it
+                while True:
+                    batch = list(islice(rows, self.STREAM_BATCH))
+                    if not batch:
+                        break
+                    results.extend(batch)
+                # Got every row we asked for: don't wait for es.exe to drain
+                truncated = (
+                    limit is not None and len(results) >= limit and proc.poll() is None
+                )
+                if truncated:
+                    proc.kill()
+                returncode = proc.wait()
+                stderr = ""
+                if not truncated:
+                    err_file.seek(0)
+                    stderr = err_file.read().decode(errors="replace")
+            finally:
+                timer.cancel()
+                proc.stdout.close()
+                err_file.close()
+
+            if expired.is_set():
+                raise subprocess.TimeoutExpired(cmd, 30)
+
+            logger.debug("ES process completed with return code: %s", returncode)
+
+            if returncode != 0 and not truncated:
+                error_msg = f"ES returned error code {returncode}"
+                if stderr:
+                    error_msg += f": {stderr.strip()}"
                 logging.error(f"ES execution failed: {error_msg}")
                 return [], error_msg
 
-            results = self._parse_output(result.stdout, options)
+            self._log_first_results(results)
 
             # Verify ES sorting worked, fall back to Python if needed
             if results:
                 sorted_results = self._verify_and_fix_sorting(results, options)
-                logging.debug(
-                    f"Final results: {len(sorted_results)} (ES + Python verification)"
+                logger.debug(
+                    "Final results: %d (ES + Python verification)", len(sorted_results)
                 )
                 return sorted_results, ""
             else:
@@ -1812,6 +2659,18 @@ class ESExecutor:
             logging.error(f"Unexpected error executing ES: {e}", exc_info=True)
             return [], f"Error executing search: {str(e)}"
 
+    @staticmethod
+    def _row_limit(cmd: List[str]) -> Optional[int]:
+        """The -max-results/-n value es.exe will honour, if any."""
+        for i in range(len(cmd) - 2, 0, -1):
+            if cmd[i] in _MAX_RESULTS_SWITCHES:
+                try:
+                    limit = int(cmd[i + 1])
+                except ValueError:
+                    return None
+                return limit if limit > 0 else None
+        return None
+
     def _verify_and_fix_sorting(
         self, results: List[SearchResult], options: SearchOptions
     ) -> List[SearchResult]:
@@ -1819,6 +2678,16 @@ class ESExecutor:
         if len(results) < 2:
             return results
 
+        flag = _TRUSTED_ES_SORTS.get(options.sort_field)
+        if flag and getattr(options, flag):
+            if self._trusted_sort_checked or not logger.isEnabledFor(logging.DEBUG):
+                return results
+            self._trusted_sort_checked = True
+            if self._check_es_sorting(results, options):
+                return results
+            logger.warning("ES %s sort failed the spot check", options.sort_field.value)
+            return self._python_sort_results(results, options)
+
         # Check if ES sorting actually worked
         es_sorted_correctly = self._check_es_sorting(results, options)
 
@@ -1838,46 +2707,23 @@ class ESExecutor:
         if len(results) < 2:
             return True
 
-        # Sample first few results to check sorting
-        sample_size = min(5, len(results))
-
-        for i in range(sample_size - 1):
-            current = results[i]
-            next_item = results[i + 1]
-
-            # Get comparison values
-            if options.sort_field == SortMode.NAME:
-                curr_val = current.filename.lower()
-                next_val = next_item.filename.lower()
-            elif options.sort_field == SortMode.SIZE:
-                curr_val = current.size
-                next_val = next_item.size
-            elif options.sort_field == SortMode.DATE_MODIFIED:
-                curr_val = self._parse_date(current.date_modified)
-                next_val = self._parse_date(next_item.date_modified)
-            elif options.sort_field == SortMode.PATH:
-                curr_val = os.path.dirname(current.full_path).lower()
-                next_val = os.path.dirname(next_item.full_path).lower()
-            elif options.sort_field == SortMode.EXTENSION:
-                curr_val = os.path.splitext(current.filename)[1].lower()
-                next_val = os.path.splitext(next_item.filename)[1].lower()
-            else:
-                continue
-
-            # Check sort order
-            if options.sort_ascending:
-                if curr_val > next_val:
-                    logging.debug(
-                        f"Sort verification failed: {curr_val} > {next_val} (should be ascending)"
-                    )
-                    return False
-            else:
-                if curr_val < next_val:
-                    logging.debug(
-                        f"Sort verification failed: {curr_val} < {next_val} (should be descending)"
-                    )
-                    return False
+        key = _VERIFY_KEYS.get(options.sort_field)
+        if key is None:
+            return True
 
+        # Sample first few results to check sorting
+        vals = [key(r) for r in results[:5]]
+        pairs = zip(vals, vals[1:])
+        if options.sort_ascending:
+            bad = next(((a, b) for a, b in pairs if a > b), None)
+        else:
+            bad = next(((a, b) for a, b in pairs if a < b), None)
+        if bad is not None:
+            logging.debug(
+                f"Sort verification failed: {bad[0]} vs {bad[1]} "
+                f"(should be {'ascending' if options.sort_ascending else 'descending'})"
+            )
+            return False
         return True
 
     def _python_sort_results(
@@ -1885,21 +2731,9 @@ class ESExecutor:
     ) -> List[SearchResult]:
         """Sort results using Python as fallback."""
         try:
-
-            def get_sort_key(result: SearchResult):
-                if options.sort_field == SortMode.NAME:
-                    return result.filename.lower()
-                elif options.sort_field == SortMode.SIZE:
-                    return result.size
-                elif options.sort_field == SortMode.DATE_MODIFIED:
-                    return self._parse_date(result.date_modified)
-                elif options.sort_field == SortMode.PATH:
-                    return os.path.dirname(result.full_path).lower()
-                elif options.sort_field == SortMode.EXTENSION:
-                    return os.path.splitext(result.filename)[1].lower()
-                else:
-                    return result.filename.lower()
-
+            # Pick the key extractor once; sorted() then calls it exactly
+            # once per row and stays stable for equal keys in either order
+            get_sort_key = _SORT_KEYS.get(options.sort_field, _SORT_KEYS[SortMode.NAME])
             sorted_results = sorted(
                 results, key=get_sort_key, reverse=not options.sort_ascending
             )
@@ -1912,97 +2746,95 @@ class ESExecutor:
             logging.error(f"Python sorting failed: {e}", exc_info=True)
             return results
 
-    def _parse_date(self, date_str: str) -> datetime:
-        """Parse date string to datetime for proper sorting."""
-        if not date_str:
-            return datetime.min
-
-        try:
-            # Handle es.exe format: "28/08/2025 13:05"
-            return datetime.strptime(date_str, "%d/%m/%Y %H:%M")
-        except ValueError:
-            try:
-                # Fallback format
-                return datetime.strptime(date_str, "%d/%m/%Y")
-            except ValueError:
-                logging.debug(f"Could not parse date: {date_str}")
-                return datetime.min
+    def _parse_output(
+        self, output: bytes, options: SearchOptions
+    ) -> List[SearchResult]:
+        stream = io.TextIOWrapper(io.BytesIO(output), newline="")
+        results = list(self._iter_results(stream, options))
+        self._log_first_results(results)
+        return results
 
-    def _parse_output(self, output: str, options: SearchOptions) -> List[SearchResult]:
-        import csv, io, os
+    def _log_first_results(self, results: List[SearchResult]):
+        # (Nice-to-have) small diagnostic like before
+        if results:
+            sizes = [r.size for r in results[:5]]
+            dates = [r.date_modified for r in results[:5]]
+            exts = [r.extension for r in results[:5]]
+            logging.debug(f"First 5 result sizes: {sizes}")
+            logging.debug(f"First 5 result dates: {dates}")
+            logging.debug(f"First 5 result extensions: {exts}")
 
-        results: List[SearchResult] = []
-        reader = csv.reader(io.StringIO(output))
+    def _iter_results(self, lines, options: SearchOptions) -> Iterator[SearchResult]:
+        """Yield one SearchResult per CSV row read from the *lines* iterable."""
+        reader = csv.reader(lines)
+
+        # Column positions come from the same plan build_command() emitted
+        fields = [field for _, field in self._column_plan(options)]
+        width = len(fields)
+        col = {field: i for i, field in enumerate(fields)}
+        i_size = col.get("size")
+        i_dm = col.get("date_modified")
+        i_dc = col.get("date_created")
+        i_da = col.get("date_accessed")
+        i_attr = col["attributes"]
+        i_ext = col.get("extension")
+        i_path = col["path"]
+
+        # Hoist attribute lookups out of the per-row loop
+        join = os.path.join
+        splitext = os.path.splitext
+        isdir = os.path.isdir
+        make = SearchResult
 
-        # Expected column order we emit in build_command():
-        # name, [size], [date-modified], [extension], path-column
-        # (the bracketed ones appear only if the option is enabled)
         for row in reader:
             if not row:
                 continue
+            if len(row) < width:
+                row += [""] * (width - len(row))
 
-            i = 0
-
-            # 1) name
-            name = row[i].strip() if i < len(row) else ""
-            i += 1
+            name = row[0].strip()
 
-            # 2) size (optional)
             size = 0
-            if options.show_size and i < len(row):
-                try:
-                    size = int(row[i].strip())
-                except Exception:
-                    size = 0
-                i += 1
-
-            # 3) date modified (optional)
-            date_modified = ""
-            if options.show_date_modified and i < len(row):
-                date_modified = row[i].strip()
-                i += 1
-
-            # 4) extension (optional)
-            # Everything returns extension with a leading dot (e.g. ".pdf")
-            extension = ""
-            if getattr(options, "show_extension", True) and i < len(row):
-                # Only consume if we *actually* asked for it in the command
-                # (Your build_command appends -extension when show_extension is True)
-                extension = row[i].strip().lower()
-                i += 1
-
-            # 5) path column (directory)
-            path_dir = row[i].strip() if i < len(row) else ""
-            full_path = os.path.join(path_dir, name) if path_dir else name
-
-            # If extension wasn't requested, derive it from the filename
-            if not extension:
-                extension = os.path.splitext(name)[1].lower()
-
-            # Best-effort folder flag (Everything output can be stale; guard for speed)
-            is_folder = os.path.isdir(full_path) if os.path.exists(full_path) else False
-
-            results.append(
-                SearchResult(
-                    filename=name,
-                    full_path=full_path,
-                    size=size,
-                    date_modified=date_modified,
-                    extension=extension,
-                    is_folder=is_folder,
-                )
-            )
+            if i_size is not None:
+                # int() already skips surrounding whitespace; folders send ""
+                cell = row[i_size]
+                if cell:
+                    try:
+                        size = int(cell)
+                    except ValueError:
+                        pass
 
-        # (Nice-to-have) small diagnostic like before
-        if results:
-            sizes = [r.size for r in results[:5]]
-            dates = [r.date_modified for r in results[:5]]
-            exts = [r.extension for r in results[:5]]
-            logging.debug(f"First 5 result sizes: {sizes}")
-            logging.debug(f"First 5 result dates: {dates}")
-            logging.debug(f"First 5 result extensions: {exts}")
+            path_dir = row[i_path].strip()
+            full_path = join(path_dir, name) if path_dir else name
 
-        return results
+            # Everything returns extension with a leading dot (e.g. ".pdf");
+            # derive it from the filename when it wasn't requested
+            extension = row[i_ext].strip().lower() if i_ext is not None else ""
+            if not extension:
+                extension = splitext(name)[1].lower()
+
+            attributes = row[i_attr].strip()
+            if attributes:
+                is_folder = "D" in attributes.upper()
+            else:
+                # Only reached if an engine leaves the column empty; isdir()
+                # is already False for missing paths, so one stat is enough
+                is_folder = isdir(full_path)
+
+            result = make(
+                name,
+                full_path,
+                size,
+                row[i_dm].strip() if i_dm is not None else "",
+                row[i_dc].strip() if i_dc is not None else "",
+                row[i_da].strip() if i_da is not None else "",
+                attributes,
+                extension,
+                is_folder,
+            )
+            # The path column already is the parent directory
+            result._parent = path_dir if path_dir else os.path.dirname(name)
+            yield result
 
     def export_results(
         self,
@@ -2027,15 +2859,52 @@ class ESExecutor:
             export_flag = format_map.get(format_type, "-export-csv")
             cmd.extend([export_flag, filename])
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
             return result.returncode == 0
 
         except Exception:
             return False
 
 
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+
+
+def _win32_set_clipboard(text: str) -> bool:
+    """Put text on the clipboard via user32; False if any step fails."""
+    data = text.encode("utf-16-le") + b"\x00\x00"
+    if not _OpenClipboard(None):
+        return False
+    try:
+        _EmptyClipboard()
+        handle = _GlobalAlloc(_GMEM_MOVEABLE, len(data))
+        if not handle:
+            return False
+        ptr = _GlobalLock(handle)
+        if not ptr:
+            _GlobalFree(handle)
+            return False
+        ctypes.memmove(ptr, data, len(data))
+        _GlobalUnlock(handle)
+        if not _SetClipboardData(_CF_UNICODETEXT, handle):
+            _GlobalFree(handle)
+            return False
+        # The clipboard owns the memory from here on
+        return True
+    finally:
+        _CloseClipboard()
+
+
 def copy_to_clipboard(text: str) -> bool:
-    """Copy text to Windows clipboard using PowerShell."""
+    """Copy text to the Windows clipboard (Win32 API, PowerShell fallback)."""
+    if _WIN:
+        try:
+            if _win32_set_clipboard(text):
+                logging.debug(f"Clipboard copy successful: {text[:100]}...")
+                return True
+        except Exception as e:
+            logging.debug(f"Win32 clipboard failed, trying PowerShell: {e}")
+
     try:
         import subprocess
 
@@ -2068,7 +2937,7 @@ class CopyDialog:
     def __init__(self, stdscr, result: SearchResult):
         self.stdscr = stdscr
         self.result = result
-        self.colors = Colors()
+        self.colors = get_colors()
         self.current_option = 0
 
         # Define copy options
@@ -2091,7 +2960,7 @@ class CopyDialog:
             win.keypad(True)
 
             while True:
-                win.clear()
+                win.erase()
                 try:
                     win.box()
                 except Exception:
@@ -2120,7 +2989,8 @@ class CopyDialog:
                 footer = "↑↓: Select  Enter: Copy  Esc: Cancel"
                 safe_addstr(win, dialog_h - 2, 2, footer, self.colors.INFO)
 
-                win.refresh()
+                win.noutrefresh()
+                curses.doupdate()
                 key = win.getch()
 
                 if key == 27:  # ESC
@@ -2131,16 +3001,16 @@ class CopyDialog:
                     self.current_option = min(
                         len(self.options) - 1, self.current_option + 1
                     )
-                elif key in (curses.KEY_ENTER, 10, 13):
+                elif key in ENTER_KEYS:
                     _, get_text = self.options[self.current_option]
                     return get_text()
 
         finally:
             try:
                 win.erase()
-                win.refresh()
+                win.noutrefresh()
                 self.stdscr.touchwin()
-                self.stdscr.refresh()
+                self.stdscr.noutrefresh()
             except Exception:
                 pass
 
@@ -2155,10 +3025,11 @@ class ESTUI:
         exiftool_path: Optional[str] = None,
     ):
         self.stdscr = stdscr
-        self.colors = Colors()
+        self.colors = get_colors()
         self.executor = ESExecutor(es_path)
         self.options = SearchOptions()
         self.results: List[SearchResult] = []
+        self._result_view = ResultView()
         self.current_result = 0
         self.result_offset = 0
         self.status_message = "Ready"
@@ -2167,10 +3038,27 @@ class ESTUI:
         self.current_header_col = 0  # Which header column is selected
         self.debug_mode = debug  # The state variable to toggle
         self.verbose = verbose
-        self.debug_log = []  # Store debug messages
-        self.spinner_frames = ["|", "/", "-", "\\"]
-        self.spinner_index = 0
+        self.debug_log: deque = deque(maxlen=100)  # Last debug messages
+        self._last_ts_sec = 0  # log_debug() timestamp cache
+        self._last_ts_str = ""
+        self._debug_log_maxlen = 0  # longest line ever logged; sizes the log dialog
+        self.spinner_index = 0  # progress bar animation tick
+        self.should_exit = False  # set by F10/Ctrl+Q; run() then returns
         self._ui_dirty = False  # set True whenever background work finishes
+        # Panes run() must repaint: "all", or any of "search", "header",
+        # "status", "spinner" (see render_dirty)
+        self._dirty: set = {"all"}
+        self._drawn_count = 0  # len(self.results) at the last full draw
+        self._layout_key: Optional[tuple] = None  # see _column_layout()
+        self._layout: tuple = ()
+        self._size_dirty = False  # set True on KEY_RESIZE; size is re-read lazily
+        # Header-row keys; anything else is ignored while the headers have focus
+        self._header_key_handlers = {
+            curses.KEY_LEFT: self._header_left,
+            curses.KEY_RIGHT: self._header_right,
+            curses.KEY_DOWN: self._header_down,
+            **dict.fromkeys(ENTER_KEYS, self._header_enter),
+        }
 
         # ExifTool path for metadata extraction
         self.exiftool_path = exiftool_path
@@ -2181,6 +3069,14 @@ class ESTUI:
         self.props_cache: Dict[str, Dict[str, str]] = {}
         self.props_data: Optional[Dict[str, str]] = None
 
+        # Blocking file I/O (properties, ExifTool) runs here; results land in
+        # the caches above and _on_bg_done flags a redraw
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="es-tui-bg")
+        self._bg_pending: set = set()
+        self._export_in_flight = False  # export_results() worker running
+        # Set while a properties fetch waits for navigation to settle
+        self._props_pending_at: Optional[float] = None
+
         # Setup curses
         curses.curs_set(1)
         self.stdscr.keypad(True)
@@ -2204,6 +3100,12 @@ class ESTUI:
         # Create status bar
         self.status_bar = StatusBar(self.stdscr, self.height - 1)
 
+        # Message and debug-log dialogs are modal, so they share one window
+        # that is resized and raised on open (see _open_dialog)
+        self._dialog_win = curses.newwin(self.height, self.width, 0, 0)
+        self._dialog_panel = panel.new_panel(self._dialog_win)
+        self._dialog_panel.hide()
+
         if self.debug_mode:
             self.log_debug(f"TUI initialized with debug mode enabled")
             self.log_debug(f"Terminal size: {self.width}x{self.height}")
@@ -2229,8 +3131,7 @@ class ESTUI:
         else:
             self.status_message = "Copy cancelled"
 
-        self._ui_dirty = True
-        self.draw_interface()
+        self._invalidate()
 
     def show_advanced_search(self):
         """Show the advanced search dialog and apply the generated query."""
@@ -2260,57 +3161,61 @@ class ESTUI:
             self.perform_search()
         else:
             logging.debug("Advanced search cancelled")
+            self._invalidate()
 
     def _apply_advanced_options(
         self, cmd_args: List[str], adv_options: AdvancedSearchOptions
     ):
         """Apply advanced search options to the main search options."""
+        # One pass: switch -> its value (or True for bare flags); the first
+        # occurrence wins
+        flags: Dict[str, Any] = {}
+        it = iter(cmd_args)
+        for tok in it:
+            value = next(it, None) if tok in _ES_ARG_SWITCHES else True
+            flags.setdefault(tok, value)
+
         # Update search mode based on arguments
-        if "-regex" in cmd_args:
+        if "-regex" in flags:
             self.options.mode = SearchMode.REGEX
-        elif "-case" in cmd_args:
+        elif "-case" in flags:
             self.options.mode = SearchMode.CASE_SENSITIVE
-        elif "-whole-word" in cmd_args:
+        elif "-whole-word" in flags:
             self.options.mode = SearchMode.WHOLE_WORD
-        elif "-match-path" in cmd_args:
+        elif "-match-path" in flags:
             self.options.mode = SearchMode.MATCH_PATH
         else:
             self.options.mode = SearchMode.NORMAL
 
-        self.options.match_diacritics = "-diacritics" in cmd_args
-        self.options.highlight = "-highlight" in cmd_args
+        self.options.match_diacritics = "-diacritics" in flags
+        self.options.highlight = "-highlight" in flags
 
         # Update sort options
-        if "-sort" in cmd_args:
-            sort_idx = cmd_args.index("-sort")
-            if sort_idx + 1 < len(cmd_args):
-                sort_field = cmd_args[sort_idx + 1]
-                try:
-                    self.options.sort_field = SortMode(sort_field)
-                except ValueError:
-                    pass
+        sort_field = flags.get("-sort")
+        if sort_field is not None:
+            try:
+                self.options.sort_field = SortMode(sort_field)
+            except ValueError:
+                pass
 
-        self.options.sort_ascending = "-sort-descending" not in cmd_args
+        self.options.sort_ascending = "-sort-descending" not in flags
 
         # Update limits
-        if "-max-results" in cmd_args:
-            max_idx = cmd_args.index("-max-results")
-            if max_idx + 1 < len(cmd_args):
-                try:
-                    self.options.max_results = int(cmd_args[max_idx + 1])
-                except ValueError:
-                    pass
+        max_results = flags.get("-max-results")
+        if max_results is not None:
+            try:
+                self.options.max_results = int(max_results)
+            except ValueError:
+                pass
 
         # Update filters
-        if "-path" in cmd_args:
-            path_idx = cmd_args.index("-path")
-            if path_idx + 1 < len(cmd_args):
-                self.options.path_filter = cmd_args[path_idx + 1]
+        path_filter = flags.get("-path")
+        if path_filter is not None:
+            self.options.path_filter = path_filter
 
-        if "-instance" in cmd_args:
-            inst_idx = cmd_args.index("-instance")
-            if inst_idx + 1 < len(cmd_args):
-                self.options.instance_name = cmd_args[inst_idx + 1]
+        instance_name = flags.get("-instance")
+        if instance_name is not None:
+            self.options.instance_name = instance_name
 
     def detect_terminal_capabilities(self):
         """Detect and log terminal capabilities for Unicode support"""
@@ -2347,17 +3252,31 @@ class ESTUI:
             logging.debug(f"detect_terminal_capabilities failed: {e}")
             return {}
 
-    def _draw_icon(self, y: int, x: int, result, attr) -> int:
-        """Draws a file-type icon with comprehensive error handling and fallbacks."""
-        if not getattr(self.options, "show_icons", True):
-            return 0
-
+    def _put_cell(self, y: int, x: int, text: str, w: int, attr) -> None:
+        """Write *text* padded or clipped to exactly *w* cells."""
+        n = len(text)
+        if n < w:
+            text += " " * (w - n)
         try:
-            unicode_icon = FileTypeIcons.get_icon(result, use_unicode=True)
-            ascii_icon = FileTypeIcons.get_icon(result, use_unicode=False)
+            self.stdscr.addnstr(y, x, text, min(w, self.width - 1 - x), attr)
+        except Exception:
+            safe_addstr(self.stdscr, y, x, text[:w], attr)
+
+    def _draw_icon(
+        self, y: int, x: int, result, attr, use_unicode: Optional[bool] = None
+    ) -> int:
+        """Draws a file-type icon with comprehensive error handling and fallbacks.
+
+        Row loops pass *use_unicode* (and only call this with icons enabled)
+        so the options are not re-read for every row.
+        """
+        if use_unicode is None:
+            if not self.options.show_icons:
+                return 0
+            use_unicode = self.options.use_unicode_icons
 
-            use_unicode = getattr(self.options, "use_unicode_icons", True)
-            target_icon = unicode_icon if use_unicode else ascii_icon
+        try:
+            target_icon = _icon_for_ext(result.ext_lower, result.is_folder, use_unicode)
             icon_col_w = 2 if use_unicode else 1  # reserve 2 cells for emoji
 
             try:
@@ -2365,7 +3284,8 @@ class ESTUI:
                 return icon_col_w + 1  # +1 space padding
             except Exception:
                 # Fallback to ASCII if unicode fails
-                if use_unicode and unicode_icon != ascii_icon:
+                ascii_icon = _icon_for_ext(result.ext_lower, result.is_folder, False)
+                if use_unicode and target_icon != ascii_icon:
                     try:
                         safe_addstr(self.stdscr, y, x, ascii_icon, attr)
                         return 2  # keep alignment stable
@@ -2374,7 +3294,7 @@ class ESTUI:
 
                 # Final fallback: one-letter
                 try:
-                    fallback = "D" if getattr(result, "is_folder", False) else "F"
+                    fallback = "D" if result.is_folder else "F"
                     safe_addstr(self.stdscr, y, x, fallback, attr)
                     return 2
                 except Exception:
@@ -2384,75 +3304,107 @@ class ESTUI:
 
     def _show_scroll_dialog(self, title: str, lines: List[str]):
         """Centered, scrollable text dialog. Up/Down/PgUp/PgDn/Home/End/ESC."""
-        H, W = self.stdscr.getmaxyx()
-        dlg_h = min(max(10, H - 6), H - 2)
-        dlg_w = min(max(40, int(W * 0.8)), W - 2)
-        y0 = (H - dlg_h) // 2
-        x0 = (W - dlg_w) // 2
-
-        win = curses.newwin(dlg_h, dlg_w, y0, x0)
-        win.keypad(True)
-
+        footer = "↑↓ PgUp/PgDn Home/End  Esc:Close"
+        n = len(lines)
         top = 0
+        prev_top = None  # None forces a full repaint
+        win = None
+
         while True:
-            win.clear()
-            try:
-                win.box()
-            except Exception:
-                pass
+            if prev_top is None:
+                H, W = self.stdscr.getmaxyx()
+                dlg_h = min(max(10, H - 6), H - 2)
+                dlg_w = min(max(40, int(W * 0.8)), W - 2)
+                body_h = dlg_h - 4
+                maxw = dlg_w - 4
+                top = min(top, max(0, n - body_h))
+                if win is None:
+                    win = curses.newwin(
+                        dlg_h, dlg_w, (H - dlg_h) // 2, (W - dlg_w) // 2
+                    )
+                    win.keypad(True)
+                else:
+                    win.resize(dlg_h, dlg_w)
+                    win.mvwin((H - dlg_h) // 2, (W - dlg_w) // 2)
+                    self.stdscr.erase()
+                    self.stdscr.noutrefresh()
 
-            # Title
-            tx = max(1, (dlg_w - len(title) - 2) // 2)
-            try:
-                win.addstr(0, tx, f" {title} ", self.colors.HEADER)
-            except Exception:
-                pass
+                win.erase()
+                try:
+                    win.box()
+                except Exception:
+                    pass
 
-            # Draw a window of lines
-            body_h = dlg_h - 4
-            view = lines[top : top + body_h]
-            for i, line in enumerate(view):
-                # wrap long lines
-                remaining = line
-                col = 2
-                row = 2 + i
-                maxw = dlg_w - 4
-                if len(remaining) > maxw:
-                    remaining = remaining[:maxw]
+                # Title
+                tx = max(1, (dlg_w - len(title) - 2) // 2)
                 try:
-                    win.addstr(row, col, remaining)
+                    win.addstr(0, tx, f" {title} ", self.colors.HEADER)
                 except Exception:
                     pass
 
-            # Footer
-            footer = "↑↓ PgUp/PgDn Home/End  Esc:Close"
-            try:
-                win.addstr(dlg_h - 1, 2, footer[: dlg_w - 4], self.colors.INFO)
-            except Exception:
-                pass
+                for i, line in enumerate(lines[top : top + body_h]):
+                    safe_addstr(win, 2 + i, 2, _clip_cells(line, maxw))
+
+                # Footer
+                try:
+                    win.addstr(dlg_h - 1, 2, footer[: dlg_w - 4], self.colors.INFO)
+                except Exception:
+                    pass
 
-            win.refresh()
+                # Body rows scroll in place; the border columns move with them
+                try:
+                    win.setscrreg(2, dlg_h - 3)
+                except curses.error:
+                    pass
+            elif top != prev_top:
+                delta = top - prev_top
+                if abs(delta) < body_h:
+                    # Scrolling stays off otherwise, so a write that reaches
+                    # the bottom row can never shift the region by accident
+                    win.scrollok(True)
+                    win.scroll(delta)
+                    win.scrollok(False)
+                    exposed = (
+                        range(body_h - delta, body_h) if delta > 0 else range(-delta)
+                    )
+                else:
+                    exposed = range(body_h)
+                for i in exposed:
+                    row = 2 + i
+                    win.move(row, 1)
+                    win.clrtoeol()
+                    win.addch(row, 0, curses.ACS_VLINE)
+                    # insch: addch in the last column moves the cursor past it
+                    win.insch(row, dlg_w - 1, curses.ACS_VLINE)
+                    if top + i < n:
+                        safe_addstr(win, row, 2, _clip_cells(lines[top + i], maxw))
+
+            prev_top = top
+            win.noutrefresh()
+            curses.doupdate()
             k = win.getch()
             if k in (27,):  # ESC
                 break
+            elif k == curses.KEY_RESIZE:
+                prev_top = None
             elif k == curses.KEY_UP:
                 top = max(0, top - 1)
             elif k == curses.KEY_DOWN:
-                top = min(max(0, len(lines) - body_h), top + 1)
+                top = min(max(0, n - body_h), top + 1)
             elif k == curses.KEY_PPAGE:
                 top = max(0, top - body_h)
             elif k == curses.KEY_NPAGE:
-                top = min(max(0, len(lines) - body_h), top + body_h)
+                top = min(max(0, n - body_h), top + body_h)
             elif k == curses.KEY_HOME:
                 top = 0
             elif k == curses.KEY_END:
-                top = max(0, len(lines) - body_h)
+                top = max(0, n - body_h)
 
         try:
             win.erase()
-            win.refresh()
+            win.noutrefresh()
             self.stdscr.touchwin()
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
         except Exception:
             pass
 
@@ -2476,20 +3428,7 @@ class ESTUI:
                 self._ui_dirty = True
                 return
             try:
-                # Configure PyExifTool for proper UTF-8 handling on Windows
-                kw = {
-                    "encoding": "utf-8",  # Force UTF-8 encoding
-                    "common_args": [
-                        "-charset",
-                        "utf8",
-                    ],  # Tell ExifTool to output UTF-8
-                }
-
-                if self.exiftool_path:
-                    kw["executable"] = self.exiftool_path
-
-                with exiftool.ExifToolHelper(**kw) as et:
-                    out = et.get_metadata(path)
+                out = get_metadata_batch([path], self.exiftool_path)
                 data = out[0] if out else {"Error": "No metadata returned"}
                 self.exif_cache[path] = data
 
@@ -2527,31 +3466,80 @@ class ESTUI:
                 return
 
         # Build display lines from the dict. Keep SourceFile first, then sorted keys.
-        lines: List[str] = []
-        if "SourceFile" in data:
-            lines.append(f"SourceFile = {data['SourceFile']}")
-        for k in sorted(data.keys()):
-            if k == "SourceFile":
-                continue
-            v = data[k]
-            # normalize values with better Unicode handling
-            try:
-                if isinstance(v, (list, tuple)):
-                    v = ", ".join(str(x) for x in v)
-                elif isinstance(v, dict):
-                    v = json.dumps(v, ensure_ascii=False)
-                else:
-                    v = str(v)
-                lines.append(f"{k} = {v}")
-            except UnicodeEncodeError:
-                # Handle problematic Unicode characters
-                v_safe = str(v).encode("ascii", "backslashreplace").decode("ascii")
-                lines.append(f"{k} = {v_safe}")
+        # Non-encodable characters are dealt with by safe_addstr at draw time.
+        lines: List[str] = (
+            [f"SourceFile = {data['SourceFile']}"] if "SourceFile" in data else []
+        )
+        lines.extend(
+            f"{k} = {_exif_value_str(v)}"
+            for k, v in sorted(data.items())
+            if k != "SourceFile"
+        )
+
+        # Neighbours load while the dialog is open, so F6 on them is instant
+        self._prefetch_exif_neighbours()
 
         title = "ExifTool Metadata"
         self._show_scroll_dialog(title, lines)
+        self._invalidate()
+
+    EXIF_PREFETCH_RADIUS = 2  # rows either side of the selection
+
+    def _prefetch_exif_neighbours(self):
+        """Fetch nearby uncached files' metadata in one background exiftool call."""
+        lo = max(0, self.current_result - self.EXIF_PREFETCH_RADIUS)
+        hi = min(len(self.results), self.current_result + self.EXIF_PREFETCH_RADIUS + 1)
+        batch = [
+            r.full_path
+            for r in self.results[lo:hi]
+            if not r.is_folder
+            and r.full_path not in self.exif_cache
+            and ("exif", r.full_path) not in self._bg_pending
+        ]
+        if batch:
+            self._submit_bg(
+                "exif", batch, get_metadata_batch, batch, self.exiftool_path
+            )
+
+    def _submit_bg(self, kind: str, key, fn, *args):
+        """Run *fn* on the background pool; _on_bg_done files the result."""
+        keys = key if isinstance(key, list) else [key]
+        self._bg_pending.update((kind, k) for k in keys)
+        fut = self._pool.submit(fn, *args)
+        fut.add_done_callback(lambda f: self._on_bg_done(kind, key, f))
+
+    def _on_bg_done(self, kind: str, key, fut):
+        """Store a finished background result and ask run() for a redraw."""
+        try:
+            result = fut.result()
+            error = None
+        except Exception as e:
+            result = None
+            error = e
+
+        if kind == "props":
+            if error is not None:
+                logging.error(f"gather_file_properties failed: {error}")
+                result = {"Error": str(error)}
+            self.props_cache[key] = result
+            if self.props_visible and self._selected_path() == key:
+                self.props_data = result
+        elif kind == "exif":
+            # Only trust a batch that answered every file, in order
+            if error is not None:
+                logging.debug(f"ExifTool prefetch failed: {error}")
+            elif len(result) == len(key):
+                self.exif_cache.update(zip(key, result))
+
+        keys = key if isinstance(key, list) else [key]
+        self._bg_pending.difference_update((kind, k) for k in keys)
         self._ui_dirty = True
-        self.draw_interface()
+
+    def _selected_path(self) -> Optional[str]:
+        if not self.results:
+            return None
+        sel = self.results[max(0, min(self.current_result, len(self.results) - 1))]
+        return getattr(sel, "full_path", sel.filename)
 
     def toggle_properties(self):
         """Toggle the properties pane for the current selection."""
@@ -2562,48 +3550,53 @@ class ESTUI:
 
         self.props_visible = not getattr(self, "props_visible", False)
         if self.props_visible:
-            sel = self.results[max(0, min(self.current_result, len(self.results) - 1))]
-            path = getattr(sel, "full_path", sel.filename)
-            # cache
-            if path not in self.props_cache:
-                try:
-                    self.props_cache[path] = gather_file_properties(path)
-                except Exception as e:
-                    logging.error(f"gather_file_properties failed: {e}", exc_info=True)
-                    self.props_cache[path] = {"Error": str(e)}
-            self.props_data = self.props_cache[path]
+            self._collect_props_data()
         else:
             self.props_data = None
-        self._ui_dirty = True
-        self.draw_interface()
+        self._invalidate()
+
+    def _collect_props_data(self, defer: bool = False):
+        """Point props_data at the selection's properties, loading them if needed.
+
+        With *defer*, a cache miss only shows the placeholder; run() starts the
+        fetch once the selection has rested for PROPS_DEBOUNCE seconds.
+        """
+        self._props_pending_at = None
+        path = self._selected_path()
+        if path is None:
+            self.props_data = None
+        elif path in self.props_cache:
+            self.props_data = self.props_cache[path]
+        else:
+            # Placeholder until the worker fills the cache
+            self.props_data = {
+                "Name": os.path.basename(path) or path,
+                "Location": "(loading...)",
+            }
+            if defer:
+                self._props_pending_at = time.monotonic()
+            elif ("props", path) not in self._bg_pending:
+                self._submit_bg("props", path, gather_file_properties, path)
 
     def _draw_kv_lines(self, x, y, w, items):
-        """Key: Value table writer using safe_addstr with wrapping."""
+        """Key: Value table writer; values wrap under their own column."""
+        key_attr = getattr(self.colors, "HIGHLIGHT", 0)
+        val_attr = getattr(self.colors, "NORMAL", 0)
+        addnstr = self.stdscr.addnstr
         line = y
         for k, v in items:
             key = f"{k}:"
-            safe_addstr(self.stdscr, line, x, key, getattr(self.colors, "HIGHLIGHT", 0))
-            # wrap value
+            safe_addstr(self.stdscr, line, x, key, key_attr)
+            # wrap value, one addnstr per chunk
             val = str(v or "")
+            vx = x + len(key) + 1
             avail = max(1, w - len(key) - 1)
-            start = 0
-            first = True
-            while start < len(val) or first:
-                chunk = val[start : start + avail]
-                safe_addstr(
-                    self.stdscr,
-                    line,
-                    x + len(key) + 1,
-                    chunk,
-                    getattr(self.colors, "NORMAL", 0),
-                )
-                start += len(chunk)
-                if start < len(val):
-                    line += 1
-                else:
-                    break
-                first = False
-            line += 1
+            for start in range(0, len(val) or 1, avail):
+                try:
+                    addnstr(line, vx, val[start:], avail, val_attr)
+                except curses.error:
+                    pass
+                line += 1
         return line
 
     def draw_properties_pane(self):
@@ -2617,8 +3610,9 @@ class ESTUI:
         h = H - 2
 
         # separator
+        sep_attr = getattr(self.colors, "INFO", 0)
         for r in range(y0, y0 + h):
-            safe_addstr(self.stdscr, r, x0 - 1, "│", getattr(self.colors, "INFO", 0))
+            safe_addstr(self.stdscr, r, x0 - 1, "│", sep_attr)
 
         # title
         title = " Properties "
@@ -2661,39 +3655,115 @@ class ESTUI:
     def log_debug(self, message: str):
         """Log debug message with timestamp"""
         if self.debug_mode:
-            timestamp = time.strftime("%H:%M:%S")
-            debug_msg = f"[{timestamp}] {message}"
+            # Format the clock once per wall-clock second, not per message
+            now = int(time.time())
+            if now != self._last_ts_sec:
+                self._last_ts_sec = now
+                self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+            debug_msg = f"[{self._last_ts_str}] {message}"
+            # The deque drops the oldest message once 100 are kept
             self.debug_log.append(debug_msg)
+            if len(debug_msg) > self._debug_log_maxlen:
+                self._debug_log_maxlen = len(debug_msg)
 
-            # Keep only last 100 debug messages to prevent memory issues
-            if len(self.debug_log) > 100:
-                self.debug_log.pop(0)
+    PROPS_DEBOUNCE = 0.15  # seconds the selection must rest before a props fetch
 
     def run(self):
-        """Main TUI loop with idle redraws for background work."""
+        """Main TUI loop; repaints only what input or background work invalidated."""
         self.draw_interface()
+        curses.doupdate()
         while True:
             self.handle_input()  # getch() returns every 100 ms (timeout set)
             if self.should_exit:
+                self._pool.shutdown(wait=False)
                 break
-            # While searching: animate & redraw on every idle tick.
-            # When results land: redraw once (_ui_dirty is set by the worker).
-            if self.search_active or getattr(self, "_ui_dirty", False):
-                if self.search_active:
-                    self.spinner_index = (self.spinner_index + 1) % len(
-                        self.spinner_frames
-                    )
-                self.draw_interface()
+            # Key repeat has paused: load the properties for where it stopped
+            if (
+                self._props_pending_at is not None
+                and time.monotonic() - self._props_pending_at >= self.PROPS_DEBOUNCE
+            ):
+                if self.props_visible:
+                    self._collect_props_data()
+                self._props_pending_at = None
+            # Workers set _ui_dirty; clear it first so a late one is not lost
+            if self._ui_dirty:
                 self._ui_dirty = False
+                self._dirty.add("all")
+            # While searching, animate the progress bar every idle tick and
+            # redraw the table only while streamed rows can still show in it
+            if self.search_active:
+                self.spinner_index += 1
+                if len(self.results) == self._drawn_count:
+                    self._dirty.add("spinner")
+                elif self._drawn_count >= self._table_rows():
+                    self._dirty.add("status")
+                else:
+                    self._dirty.add("all")
+            # One terminal flush per iteration, and none on an idle tick
+            if self.render_dirty():
+                curses.doupdate()
+
+    def _invalidate(self, *panes: str):
+        """Mark panes for the next render_dirty(); no arguments means everything."""
+        self._dirty.update(panes or ("all",))
+
+    def render_dirty(self) -> bool:
+        """Repaint the invalidated panes, falling back to a full draw.
+
+        Returns False when nothing was dirty, so there is nothing to flush.
+        """
+        dirty = self._dirty
+        if not dirty:
+            return False
+        self._dirty = set()
+        if "all" in dirty or self._size_dirty:
+            self.draw_interface()
+            return True
+
+        # Partial paints leave the cursor where the search field put it
+        cy, cx = self.stdscr.getyx()
+        if "search" in dirty:
+            self.draw_search_field()
+            cy, cx = self.stdscr.getyx()
+        if "header" in dirty and self.results:
+            # Header focus moved: only the highlight on row 3 changes
+            left_pad = self.TABLE_LEFT
+            headers, widths = self._column_layout(self._table_width(), left_pad)[:2]
+            self._draw_headers(self.RESULTS_Y - 1, left_pad, headers, widths)
+        if "status" in dirty:
+            # Streamed rows beyond the visible table: only the count and
+            # the scrollbar thumb change
+            self.status_bar.update(self._status_text())
+            rows = self._table_rows()
+            if len(self.results) > rows and not self.props_visible:
+                self._draw_scrollbar(self.RESULTS_Y, rows)
+        if "spinner" in dirty or "status" in dirty:
+            self._draw_progress()  # after the status line, which clears its row
+        self.stdscr.move(cy, cx)
+        self.stdscr.noutrefresh()
+        return True
+
+    def _update_size(self):
+        """Re-read the terminal size after a KEY_RESIZE."""
+        self.height, self.width = self.stdscr.getmaxyx()
+        self.status_bar.resize(self.height, self.width)
+        self._size_dirty = False
+        # The terminal's contents are unknown after a resize: repaint it all
+        self.stdscr.clearok(True)
 
     def draw_interface(self):
         """Draw the complete TUI interface"""
-        self.stdscr.clear()
+        if self._size_dirty:
+            self._update_size()
+        # erase() only blanks curses' virtual screen; refresh() then sends just
+        # the cells that differ from what the terminal already shows
+        self.stdscr.erase()
 
         # Draw title bar
         title = "ES TUI - Everything Search"
-        self.stdscr.addstr(0, 0, " " * self.width, self.colors.HEADER)
-        self.stdscr.addstr(0, 2, title, self.colors.HEADER)
+        header_attr = self.colors.HEADER
+        self.stdscr.addstr(0, 0, " " * self.width, header_attr)
+        self.stdscr.addstr(0, 2, title, header_attr)
 
         # Show current options in title bar
         options_text = (
@@ -2701,7 +3771,7 @@ class ESTUI:
         )
         if len(options_text) < self.width - len(title) - 10:
             self.stdscr.addstr(
-                0, self.width - len(options_text) - 2, options_text, self.colors.HEADER
+                0, self.width - len(options_text) - 2, options_text, header_attr
             )
 
         # Draw search field
@@ -2722,44 +3792,46 @@ class ESTUI:
             self.height - 2, 0, help_text[: self.width - 1], self.colors.INFO
         )
 
-        # Update status bar
+        self.status_bar.update(self._status_text())
+
+        self.draw_properties_pane()
+
+        self._draw_progress()
+        self._drawn_count = len(self.results)
+        self._dirty.clear()
+
+        # Flushed by the single curses.doupdate() in run()
+        self.stdscr.noutrefresh()
+
+    def _status_text(self) -> str:
+        """Status line: result count and selection, else the last message."""
         result_count = len(self.results)
         if result_count > 0:
             status = f"Found {result_count} results | Selected: {self.current_result + 1}/{result_count}"
             if self.current_focus == "headers":
                 # Show which column is selected
-                header_names = []
-                if getattr(self.options, "show_icons", True):
-                    header_names.append("Icon")
-                header_names.extend(["Name"])
-                if getattr(self.options, "show_size", False):
-                    header_names.append("Size")
-                if getattr(self.options, "show_date_modified", False):
-                    header_names.append("Modified")
-                header_names.append("Path")
-
-                if 0 <= self.current_header_col < len(header_names):
-                    status += f" | Header: {header_names[self.current_header_col]}"
+                columns = self._header_columns()
+                if 0 <= self.current_header_col < len(columns):
+                    label = columns[self.current_header_col][0] or "Icon"
+                    status += f" | Header: {label}"
         else:
             status = self.status_message
 
-        self.status_bar.update(status)
+        return status
 
-        self.draw_properties_pane()
-
-        # Bottom-right progress bar while searching
-        if self.search_active:
-            bar_w = 12
-            filled = self.spinner_index % (bar_w - 2)
-            bar = "[" + ("=" * filled).ljust(bar_w - 2) + "]"
-            y = self.height - 1
-            x = max(0, self.width - len(bar) - 2)
-            try:
-                self.stdscr.addstr(y, x, bar, self.colors.INFO)
-            except Exception:
-                pass
-
-        self.stdscr.refresh()
+    def _draw_progress(self):
+        """Bottom-right progress bar while searching."""
+        if not self.search_active:
+            return
+        bar_w = 12
+        filled = self.spinner_index % (bar_w - 2)
+        bar = "[" + ("=" * filled).ljust(bar_w - 2) + "]"
+        y = self.height - 1
+        x = max(0, self.width - len(bar) - 2)
+        try:
+            self.stdscr.addstr(y, x, bar, self.colors.INFO)
+        except Exception:
+            pass
 
     def draw_search_field(self):
         """Draw the search input field"""
@@ -2799,25 +3871,56 @@ class ESTUI:
         else:
             curses.curs_set(0)
 
-    def draw_results(self):
-        """Draw the results list with an optional icon and extension column.
-        Respects the right-side Properties pane if visible.
-        """
-        results_start_y = 4
-        results_height = self.height - results_start_y - 3
-        left_pad = 2
+    RESULTS_Y = 4  # first result row; the column headers sit just above it
+    TABLE_LEFT = 2  # left padding of the results table
 
-        # If a Properties pane is visible, reserve space on the right
+    def _table_rows(self) -> int:
+        """Result rows between the headers and the help and status lines."""
+        return self.height - self.RESULTS_Y - 3
+
+    def _table_width(self) -> int:
+        """Width left for the results table beside the Properties pane."""
         reserved_right = 0
         if getattr(self, "props_visible", False) and getattr(self, "props_data", None):
             # Keep in sync with draw_properties_pane()
             pane_w = min(56, max(30, self.width // 3))
             reserved_right = pane_w + 1  # +1 for the vertical separator
+        return max(20, self.width - reserved_right)
+
+    def _draw_headers(self, header_y: int, left_pad: int, headers, widths) -> None:
+        """Column headers with the sort arrow and the header-focus highlight."""
+        sorted_header = _SORT_HEADERS.get(self.options.sort_field)
+        arrow = " ↑" if self.options.sort_ascending else " ↓"
+        header_attr = self.colors.HEADER
+        # Index of the highlighted header, or -1 when headers lack focus
+        focus_col = self.current_header_col if self.current_focus == "headers" else -1
+        x_pos = left_pad
+        for i, (header, width) in enumerate(zip(headers, widths)):
+            # Determine header attribute
+            attr = self.colors.SELECTED if i == focus_col else header_attr
+
+            # Add sort indicator to current sort column
+            if header == sorted_header:
+                display_header = header + arrow
+            else:
+                display_header = header
+
+            self._put_cell(header_y, x_pos, display_header, width, attr)
+            x_pos += width + 1
+
+    def draw_results(self):
+        """Draw the results list with an optional icon and extension column.
+        Respects the right-side Properties pane if visible.
+        """
+        results_start_y = self.RESULTS_Y
+        results_height = self._table_rows()
+        left_pad = self.TABLE_LEFT
+        effective_width = self._table_width()
 
-        effective_width = max(20, self.width - reserved_right)
+        n = len(self.results)
 
         # No results: write a centered message (within effective area)
-        if not self.results:
+        if not n:
             if self.search_active:
                 msg = "Searching..."
             elif self.search_field:
@@ -2836,12 +3939,103 @@ class ESTUI:
         elif self.current_result >= self.result_offset + results_height:
             self.result_offset = self.current_result - results_height + 1
 
-        # ----- Column widths -----
+        headers, widths, icon_w, size_w, date_w, ext_w, path_w, row_fmt, gaps = (
+            self._column_layout(effective_width, left_pad)
+        )
+        self._draw_headers(results_start_y - 1, left_pad, headers, widths)
+
+        # ----- Draw rows -----
+        # Per-frame settings, read once rather than per row
+        use_unicode = self.options.use_unicode_icons
+        size_format = self.options.size_format
+        colors = self.colors
+        cur_attr = (
+            colors.SELECTED if self.current_focus == "results" else colors.HIGHLIGHT
+        )
+        folder_attr, normal_attr = colors.FOLDER, colors.NORMAL
+        current = self.current_result
+        addnstr = self.stdscr.addnstr
+        chgat = self.stdscr.chgat
+        right = self.width - 1  # leave the last column alone, as safe_addstr does
+        view = self._result_view
+        view.scroll_to(self.results, self.result_offset, results_height)
+        for i in range(len(view.results)):
+            idx = self.result_offset + i
+            y = results_start_y + i
+
+            # Row attribute
+            if idx == current:
+                attr = cur_attr
+            elif view.is_folder[i]:
+                attr = folder_attr
+            else:
+                attr = normal_attr
+
+            # Draw the row; do NOT clrtoeol to avoid erasing the properties pane
+            x_pos = left_pad
+
+            # Icon
+            if icon_w:
+                x_pos += self._draw_icon(y, x_pos, view.results[i], attr, use_unicode)
+
+            # Remaining cells go through the layout's fixed-width template
+            cells = [view.filenames[i]]
+            if size_w:
+                size = view.sizes[i]
+                if isinstance(size, int) and size > 0:
+                    cells.append(_format_size_cached(size_format, size))
+                elif isinstance(size, str):
+                    cells.append(size)
+                else:
+                    cells.append("")
+            if date_w:
+                cells.append(view.dates[i])
+            if ext_w:
+                cells.append(view.extensions[i])
+            cells.append(view.parents[i])
+            # addnstr clips at the screen edge in C; safe_addstr is the fallback
+            line = row_fmt % tuple(cells)
+            try:
+                addnstr(y, x_pos, line, right - x_pos, attr)
+            except Exception:
+                safe_addstr(self.stdscr, y, x_pos, line, attr)
+            # Column gaps stay unattributed, so the highlight bar breaks there
+            for gx in gaps:
+                if x_pos + gx < right:
+                    chgat(y, x_pos + gx, 1, 0)
+
+        # ----- Scrollbar (skip if a Properties pane is visible to avoid overlap) -----
+        if n > results_height and not getattr(self, "props_visible", False):
+            self._draw_scrollbar(results_start_y, results_height)
+
+    def _column_layout(self, effective_width: int, left_pad: int) -> tuple:
+        """(headers, widths, icon_w, size_w, date_w, ext_w, path_w, row_fmt, gaps).
+
+        row_fmt is a %-template that pads and clips every cell after the icon
+        to its column width, so a row is formatted and written in one go.
+        gaps are the offsets of the one-cell separators within that line.
+
+        Only the width and column toggles feed into it, so the result is kept
+        until one of them changes (resize, F7/F8, options, properties pane).
+        """
+        opts = self.options
+        key = (
+            effective_width,
+            left_pad,
+            opts.show_icons,
+            opts.use_unicode_icons,
+            opts.show_size,
+            opts.show_date_modified,
+            opts.show_extension,
+        )
+        if key == self._layout_key:
+            return self._layout
+
         # Icon column (optional)
         icon_w = 0
-        if getattr(self.options, "show_icons", True):
+        if opts.show_icons:
             # reserve 2 cells for emoji (often double-width), plus 1 space padding
-            icon_w = 3 if getattr(self.options, "use_unicode_icons", True) else 2
+            icon_w = 3 if opts.use_unicode_icons else 2
 
         # Name column
         name_w = min(40, effective_width // 3)
@@ -2861,7 +4055,7 @@ class ESTUI:
 
         # Fixed width for Size (right-aligned) if enabled
         size_w = 0
-        if getattr(self.options, "show_size", False) and remaining > 11:
+        if opts.show_size and remaining > 11:
             size_w = 10
             headers.append("Size")
             widths.append(size_w)
@@ -2869,7 +4063,7 @@ class ESTUI:
 
         # Fixed width for Modified (left-aligned) if enabled
         date_w = 0
-        if getattr(self.options, "show_date_modified", False) and remaining > 18:
+        if opts.show_date_modified and remaining > 18:
             date_w = 19
             headers.append("Modified")
             widths.append(date_w)
@@ -2877,7 +4071,7 @@ class ESTUI:
 
         # Dedicated extension column (optional)
         ext_w = 0
-        if getattr(self.options, "show_extension", True) and remaining > 7:
+        if opts.show_extension and remaining > 7:
             ext_w = 6
             headers.append("Ext")
             widths.append(ext_w)
@@ -2888,147 +4082,35 @@ class ESTUI:
         headers.append("Path")
         widths.append(path_w)
 
-        # ----- Draw headers -----
-        header_y = results_start_y - 1
-        x_pos = left_pad
-        for i, (header, width) in enumerate(zip(headers, widths)):
-            # Determine header attribute
-            if self.current_focus == "headers" and i == self.current_header_col:
-                attr = self.colors.SELECTED
-            else:
-                attr = self.colors.HEADER
-
-            # Add sort indicator to current sort column
-            display_header = header
-            if header == "Name" and self.options.sort_field == SortMode.NAME:
-                display_header += " ↑" if self.options.sort_ascending else " ↓"
-            elif header == "Size" and self.options.sort_field == SortMode.SIZE:
-                display_header += " ↑" if self.options.sort_ascending else " ↓"
-            elif (
-                header == "Modified"
-                and self.options.sort_field == SortMode.DATE_MODIFIED
-            ):
-                display_header += " ↑" if self.options.sort_ascending else " ↓"
-            elif header == "Ext" and self.options.sort_field == SortMode.EXTENSION:
-                display_header += " ↑" if self.options.sort_ascending else " ↓"
-            elif header == "Path" and self.options.sort_field == SortMode.PATH:
-                display_header += " ↑" if self.options.sort_ascending else " ↓"
-
-            safe_addstr(
-                self.stdscr,
-                header_y,
-                x_pos,
-                display_header.ljust(width)[:width],
-                attr,
-            )
-            x_pos += width + 1
-
-        # ----- Draw rows -----
-        for i in range(results_height):
-            idx = self.result_offset + i
-            if idx >= len(self.results):
-                break
-
-            r = self.results[idx]
-            y = results_start_y + i
-
-            # Row attribute
-            if idx == self.current_result:
-                attr = (
-                    self.colors.SELECTED
-                    if self.current_focus == "results"
-                    else self.colors.HIGHLIGHT
-                )
-            elif getattr(r, "is_folder", False):
-                attr = self.colors.FOLDER
-            else:
-                attr = self.colors.NORMAL
-
-            # Draw each column; do NOT clrtoeol to avoid erasing the properties pane
-            x_pos = left_pad
-            col_i = 0
-
-            # Icon
-            if icon_w:
-                consumed = self._draw_icon(y, x_pos, r, attr)
-                x_pos += consumed
-                col_i += 1
-
-            # Name
-            name_text = getattr(r, "filename", "")
-            safe_addstr(
-                self.stdscr,
-                y,
-                x_pos,
-                name_text[: widths[col_i]].ljust(widths[col_i]),
-                attr,
-            )
-            x_pos += widths[col_i] + 1
-            col_i += 1
-
-            # Size
-            if size_w and col_i < len(widths):
-                size_text = ""
-                try:
-                    if isinstance(r.size, int) and r.size > 0:
-                        size_text = self._format_size(r.size)
-                    elif isinstance(r.size, str):
-                        size_text = r.size
-                except Exception:
-                    size_text = ""
-                safe_addstr(
-                    self.stdscr,
-                    y,
-                    x_pos,
-                    size_text.rjust(widths[col_i])[: widths[col_i]],
-                    attr,
-                )
-                x_pos += widths[col_i] + 1
-                col_i += 1
-
-            # Modified
-            if date_w and col_i < len(widths):
-                dt = getattr(r, "date_modified", "") or ""
-                safe_addstr(
-                    self.stdscr,
-                    y,
-                    x_pos,
-                    dt[: widths[col_i]].ljust(widths[col_i]),
-                    attr,
-                )
-                x_pos += widths[col_i] + 1
-                col_i += 1
-
-            # Extension
-            if ext_w and col_i < len(widths):
-                ext_text = getattr(r, "extension", "") or ""
-                safe_addstr(
-                    self.stdscr,
-                    y,
-                    x_pos,
-                    ext_text[: widths[col_i]].ljust(widths[col_i]),
-                    attr,
-                )
-                x_pos += widths[col_i] + 1
-                col_i += 1
-
-            # Path (parent directory)
-            if col_i < len(widths):
-                full_path = getattr(r, "full_path", "") or ""
-                parent = os.path.dirname(full_path) if full_path else ""
-                safe_addstr(
-                    self.stdscr,
-                    y,
-                    x_pos,
-                    parent[: widths[col_i]].ljust(widths[col_i]),
-                    attr,
-                )
-
-        # ----- Scrollbar (skip if a Properties pane is visible to avoid overlap) -----
-        if len(self.results) > results_height and not getattr(
-            self, "props_visible", False
-        ):
-            self._draw_scrollbar(results_start_y, results_height)
+        # Name/Ext/Modified/Path left-aligned, Size right-aligned; "." clips
+        cells = [(name_w, "-")]
+        if size_w:
+            cells.append((size_w, ""))
+        if date_w:
+            cells.append((date_w, "-"))
+        if ext_w:
+            cells.append((ext_w, "-"))
+        cells.append((path_w, "-"))
+        row_fmt = " ".join(f"%{align}{w}.{w}s" for w, align in cells)
+        gaps, x = [], 0
+        for w, _ in cells[:-1]:
+            x += w
+            gaps.append(x)
+            x += 1
+
+        self._layout_key = key
+        self._layout = (
+            tuple(headers),
+            tuple(widths),
+            icon_w,
+            size_w,
+            date_w,
+            ext_w,
+            path_w,
+            row_fmt,
+            tuple(gaps),
+        )
+        return self._layout
 
     def _draw_scrollbar(self, start_y: int, height: int):
         """Draw a scrollbar on the right side"""
@@ -3041,43 +4123,32 @@ class ESTUI:
             self.result_offset * (height - thumb_size) // max(1, total_results - height)
         )
 
-        # Draw scrollbar track
-        for y in range(start_y, start_y + height):
-            self.stdscr.addch(y, scrollbar_x, "│", self.colors.INFO)
+        # Draw scrollbar track in one call (ACS_VLINE renders as "│")
+        self.stdscr.vline(
+            start_y, scrollbar_x, curses.ACS_VLINE | self.colors.INFO, height
+        )
 
-        # Draw thumb
-        for y in range(start_y + thumb_pos, start_y + thumb_pos + thumb_size):
-            if y < start_y + height:
-                self.stdscr.addch(y, scrollbar_x, "█", self.colors.HIGHLIGHT)
+        # Draw thumb; "█" does not fit a chtype, so vline() cannot draw it
+        thumb_end = min(start_y + thumb_pos + thumb_size, start_y + height)
+        for y in range(start_y + thumb_pos, thumb_end):
+            self.stdscr.addch(y, scrollbar_x, "█", self.colors.HIGHLIGHT)
 
     def _format_size(self, size_bytes: int) -> str:
         """Format file size according to current settings"""
-        if self.options.size_format == 0:  # Auto
-            if size_bytes < 1024:
-                return f"{size_bytes} B"
-            elif size_bytes < 1024 * 1024:
-                return f"{size_bytes / 1024:.1f} KB"
-            elif size_bytes < 1024 * 1024 * 1024:
-                return f"{size_bytes / (1024 * 1024):.1f} MB"
-            else:
-                return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-        elif self.options.size_format == 1:  # Bytes
-            return f"{size_bytes:,}"
-        elif self.options.size_format == 2:  # KB
-            return f"{size_bytes / 1024:.1f}"
-        elif self.options.size_format == 3:  # MB
-            return f"{size_bytes / (1024 * 1024):.1f}"
-        else:
-            return str(size_bytes)
+        return _format_size_cached(self.options.size_format, size_bytes)
 
     def handle_input(self):
         """Handle keyboard input"""
-        self.should_exit = False
         key = self.stdscr.getch()
 
         if key == -1:  # No input (timeout)
             return
 
+        if key == curses.KEY_RESIZE:
+            self._size_dirty = True
+            self._ui_dirty = True
+            return
+
         if self.debug_mode:
             logging.debug(
                 f"Key pressed: {key} (0x{key:02x}) - '{chr(key) if 32 <= key <= 126 else '?'}'"
@@ -3101,11 +4172,11 @@ class ESTUI:
                 self.show_exif_metadata()
             elif key == curses.KEY_F7:
                 self.options.show_icons = not self.options.show_icons
-                self.draw_interface()
+                self._invalidate()
                 return
             elif key == curses.KEY_F8:
                 self.options.use_unicode_icons = not self.options.use_unicode_icons
-                self.draw_interface()
+                self._invalidate()
                 return
             elif key == curses.KEY_F9:
                 self.debug_mode = not self.debug_mode
@@ -3115,7 +4186,7 @@ class ESTUI:
                 else:
                     logging.basicConfig(level=logging.INFO)
                     logging.info("Debug mode deactivated by F9.")
-                self.draw_interface()
+                self._invalidate()
                 return
             elif key == curses.KEY_F10 or key == 17:  # F10 or Ctrl+Q
                 if self.debug_mode:
@@ -3129,7 +4200,7 @@ class ESTUI:
                 if self.debug_mode:
                     logging.debug("ESC pressed - focus to search")
                 self.current_focus = "search"
-                self.draw_interface()
+                self._invalidate()
             elif key == 3:  # Ctrl+C
                 if self.current_focus == "results" and self.results:
                     self.copy_selected()
@@ -3146,7 +4217,7 @@ class ESTUI:
             logging.error(f"Error handling key {key}: {str(e)}", exc_info=True)
             if self.debug_mode:
                 self.status_message = f"Key handling error: {str(e)}"
-                self.draw_interface()
+                self._invalidate()
 
     def show_help(self):
         """Show help dialog"""
@@ -3164,48 +4235,18 @@ class ESTUI:
             if self.debug_mode:
                 logging.debug("Help dialog closed, redrawing interface")
 
-            self.draw_interface()
+            self._invalidate()
 
         except Exception as e:
             logging.error(f"Error in show_help: {str(e)}", exc_info=True)
             self.status_message = f"Help error: {str(e)}"
-            self.draw_interface()
+            self._invalidate()
 
     def _get_key_name(self, key: int) -> str:
         """Get human-readable key name for debugging"""
-        key_names = {
-            curses.KEY_F1: "F1",
-            curses.KEY_F2: "F2",
-            curses.KEY_F3: "F3",
-            curses.KEY_F4: "F4",
-            curses.KEY_F5: "F5",
-            curses.KEY_F10: "F10",
-            curses.KEY_UP: "UP",
-            curses.KEY_DOWN: "DOWN",
-            curses.KEY_LEFT: "LEFT",
-            curses.KEY_RIGHT: "RIGHT",
-            curses.KEY_ENTER: "ENTER",
-            curses.KEY_BACKSPACE: "BACKSPACE",
-            curses.KEY_DC: "DELETE",
-            curses.KEY_HOME: "HOME",
-            curses.KEY_END: "END",
-            curses.KEY_PPAGE: "PAGE_UP",
-            curses.KEY_NPAGE: "PAGE_DOWN",
-            27: "ESC",
-            9: "TAB",
-            10: "ENTER",
-            13: "ENTER",
-            127: "BACKSPACE",
-            15: "Ctrl+O",
-            5: "Ctrl+E",
-            18: "Ctrl+R",
-            17: "Ctrl+Q",
-            8: "BACKSPACE",
-            330: "DELETE",
-        }
-
-        if key in key_names:
-            return key_names[key]
+        name = _KEY_NAMES.get(key)
+        if name is not None:
+            return name
         elif 32 <= key <= 126:
             return f"'{chr(key)}'"
         else:
@@ -3223,11 +4264,6 @@ class ESTUI:
         if self.cursor_pos < 0:
             self.cursor_pos = 0
 
-        # ---- Key groups (don’t require global constants) ----
-        BACKSPACE_KEYS = {curses.KEY_BACKSPACE, 8, 127}  # 8=Ctrl-H, 127=DEL
-        ENTER_KEYS = {curses.KEY_ENTER, 10, 13}  # LF/CR
-        DELETE_KEYS = {curses.KEY_DC, 330}  # many builds map KEY_DC to 330
-
         # ---- Actions ----
         if key in ENTER_KEYS:
             # Start a search immediately
@@ -3241,7 +4277,7 @@ class ESTUI:
                     + self.search_field[self.cursor_pos :]
                 )
                 self.cursor_pos -= 1
-                self.draw_interface()
+                self._invalidate("search")
             return
 
         elif key in DELETE_KEYS:
@@ -3250,54 +4286,47 @@ class ESTUI:
                     self.search_field[: self.cursor_pos]
                     + self.search_field[self.cursor_pos + 1 :]
                 )
-                self.draw_interface()
+                self._invalidate("search")
             return
 
         elif key == curses.KEY_LEFT:
             self.cursor_pos = max(0, self.cursor_pos - 1)
-            self.draw_interface()
+            self._invalidate("search")
             return
 
         elif key == curses.KEY_RIGHT:
             self.cursor_pos = min(len(self.search_field), self.cursor_pos + 1)
-            self.draw_interface()
+            self._invalidate("search")
             return
 
         elif key == curses.KEY_HOME:
             self.cursor_pos = 0
-            self.draw_interface()
+            self._invalidate("search")
             return
 
         elif key == curses.KEY_END:
             self.cursor_pos = len(self.search_field)
-            self.draw_interface()
+            self._invalidate("search")
             return
 
         # --- Optional, familiar shortcuts ---
         elif key == 21:  # Ctrl+U  (kill to start)
             self.search_field = self.search_field[self.cursor_pos :]
             self.cursor_pos = 0
-            self.draw_interface()
+            self._invalidate("search")
             return
 
         elif key == 11:  # Ctrl+K  (kill to end)
             self.search_field = self.search_field[: self.cursor_pos]
-            self.draw_interface()
+            self._invalidate("search")
             return
 
         elif key == 23:  # Ctrl+W  (delete previous word)
-            import re
-
             left = self.search_field[: self.cursor_pos]
-            left2 = re.sub(r"\s*\w+\Z", "", left)
-            # update after computing left2 to set correct cursor
+            left2 = _PREV_WORD_RE.sub("", left)
             self.cursor_pos = len(left2)
-            self.search_field = (
-                left2 + self.search_field[self.cursor_pos + (len(left) - len(left2)) :]
-            )
-            # Simpler: just rebuild
             self.search_field = left2 + self.search_field[len(left) :]
-            self.draw_interface()
+            self._invalidate("search")
             return
 
         # Printable characters (accept extended ASCII too)
@@ -3308,7 +4337,7 @@ class ESTUI:
                 + self.search_field[self.cursor_pos :]
             )
             self.cursor_pos += 1
-            self.draw_interface()
+            self._invalidate("search")
             return
 
         # Ignore everything else (function keys are handled in handle_input)
@@ -3326,14 +4355,12 @@ class ESTUI:
         if not self.results:
             return
 
-        ENTER_KEYS = {curses.KEY_ENTER, 10, 13}
         EXIF_KEYS = {curses.KEY_F6, ord("x"), ord("X")}
 
         def _refresh_props_if_open():
             # Rebuild the Properties pane for the new selection without changing visibility.
-            if getattr(self, "props_visible", False):
-                self.toggle_properties()
-                self.toggle_properties()
+            if self.props_visible:
+                self._collect_props_data(defer=True)
 
         # Actions
         if key in ENTER_KEYS:
@@ -3359,7 +4386,7 @@ class ESTUI:
                 if self.current_result < self.result_offset:
                     self.result_offset = self.current_result
                 _refresh_props_if_open()
-                self.draw_interface()
+                self._invalidate()
             return
 
         elif key in (curses.KEY_DOWN, ord("j")):
@@ -3369,7 +4396,7 @@ class ESTUI:
                 if self.current_result >= self.result_offset + visible_rows:
                     self.result_offset = self.current_result - visible_rows + 1
                 _refresh_props_if_open()
-                self.draw_interface()
+                self._invalidate()
             return
 
         elif key in (ord("c"), ord("C")):  # 'c' or 'C' for copy
@@ -3381,7 +4408,7 @@ class ESTUI:
             self.current_result = max(0, self.current_result - visible_rows)
             self.result_offset = max(0, self.result_offset - visible_rows)
             _refresh_props_if_open()
-            self.draw_interface()
+            self._invalidate()
             return
 
         elif key == curses.KEY_NPAGE:
@@ -3394,14 +4421,14 @@ class ESTUI:
                 self.result_offset + visible_rows,
             )
             _refresh_props_if_open()
-            self.draw_interface()
+            self._invalidate()
             return
 
         elif key == curses.KEY_HOME:
             self.current_result = 0
             self.result_offset = 0
             _refresh_props_if_open()
-            self.draw_interface()
+            self._invalidate()
             return
 
         elif key == curses.KEY_END:
@@ -3409,7 +4436,7 @@ class ESTUI:
             visible_rows = max(1, self.height - 6)
             self.result_offset = max(0, len(self.results) - visible_rows)
             _refresh_props_if_open()
-            self.draw_interface()
+            self._invalidate()
             return
 
         # Ignore everything else while in results mode
@@ -3427,7 +4454,7 @@ class ESTUI:
             self.current_focus = "results"
         else:  # results
             self.current_focus = "search"
-        self.draw_interface()
+        self._invalidate()
 
     def handle_header_input(self, key):
         """Handle input when headers are focused"""
@@ -3435,45 +4462,43 @@ class ESTUI:
             self.switch_focus()  # Switch away if no results
             return
 
-        # Build column list to match draw_results exactly
-        columns = []
-
-        # Icon column (if enabled)
-        if getattr(self.options, "show_icons", True):
-            columns.append(("", "icon"))
-
-        # Name column
-        columns.append(("Name", "name"))
+        handler = self._header_key_handlers.get(key)
+        if handler:
+            handler()
 
-        # Size column (if enabled)
-        if getattr(self.options, "show_size", False):
-            columns.append(("Size", "size"))
+    def _header_step(self, step: int):
+        col = max(
+            0, min(len(self._header_columns()) - 1, self.current_header_col + step)
+        )
+        # Auto-repeat against either end changes nothing: skip the repaint
+        if col != self.current_header_col:
+            self.current_header_col = col
+            self._invalidate("header", "status")
 
-        # Date Modified column (if enabled)
-        if getattr(self.options, "show_date_modified", False):
-            columns.append(("Modified", "date_modified"))
+    def _header_left(self):
+        self._header_step(-1)
 
-        # Extension column (if enabled)
-        if getattr(self.options, "show_extension", True):
-            columns.append(("Ext", "extension"))
+    def _header_right(self):
+        self._header_step(1)
 
-        # Path column
-        columns.append(("Path", "path"))
+    def _header_enter(self):
+        self._sort_by_column(self._header_columns())
 
-        # Handle navigation
-        if key == curses.KEY_LEFT:
-            self.current_header_col = max(0, self.current_header_col - 1)
-            self.draw_interface()
-        elif key == curses.KEY_RIGHT:
-            self.current_header_col = min(len(columns) - 1, self.current_header_col + 1)
-            self.draw_interface()
-        elif key in (curses.KEY_ENTER, 10, 13):
-            self._sort_by_column(columns)
-        elif key == curses.KEY_DOWN:
-            # Switch to results mode and select first result
-            self.current_focus = "results"
-            self.current_result = 0
-            self.draw_interface()
+    def _header_down(self):
+        # Switch to results mode and select first result
+        self.current_focus = "results"
+        self.current_result = 0
+        self._invalidate()
+
+    def _header_columns(self) -> tuple:
+        """Header columns for the current display toggles (cached per combination)."""
+        opts = self.options
+        return _header_columns(
+            opts.show_icons,
+            opts.show_size,
+            opts.show_date_modified,
+            opts.show_extension,
+        )
 
     def _sort_by_column(self, columns):
         """Sort results by the currently selected column"""
@@ -3482,46 +4507,35 @@ class ESTUI:
 
         _, col_type = columns[self.current_header_col]
 
-        logging.debug(f"Sorting by column: {col_type}")
-
-        # Determine new sort mode
-        new_sort_mode = None
-        if col_type == "icon":
-            # Sort by extension since we can't sort by file type
-            new_sort_mode = SortMode.EXTENSION
-            logging.debug("Icon column - sorting by file extension instead")
-        elif col_type == "name":
-            new_sort_mode = SortMode.NAME
-        elif col_type == "size":
-            new_sort_mode = SortMode.SIZE
-        elif col_type == "date_modified":
-            new_sort_mode = SortMode.DATE_MODIFIED
-        elif col_type == "extension":
-            new_sort_mode = SortMode.EXTENSION
-        elif col_type == "path":
-            new_sort_mode = SortMode.PATH
+        logging.debug("Sorting by column: %s", col_type)
 
+        new_sort_mode = _COL_TO_SORT.get(col_type)
         if new_sort_mode is None:
-            logging.debug(f"Unknown column type for sorting: {col_type}")
+            logging.debug("Unknown column type for sorting: %s", col_type)
             return
 
         logging.debug(
-            f"Current sort field: {self.options.sort_field}, New sort mode: {new_sort_mode}"
+            "Current sort field: %s, New sort mode: %s",
+            self.options.sort_field,
+            new_sort_mode,
         )
 
         # Toggle sort order if same column, otherwise default to ascending
         if self.options.sort_field == new_sort_mode:
             self.options.sort_ascending = not self.options.sort_ascending
             logging.debug(
-                f"Toggling sort order to: {'ascending' if self.options.sort_ascending else 'descending'}"
+                "Toggling sort order to: %s",
+                "ascending" if self.options.sort_ascending else "descending",
             )
         else:
             self.options.sort_field = new_sort_mode
             self.options.sort_ascending = True
-            logging.debug(f"Changing sort field to: {new_sort_mode.value} ascending")
+            logging.debug("Changing sort field to: %s ascending", new_sort_mode.value)
 
         logging.debug(
-            f"Final sort: {self.options.sort_field.value} {'ascending' if self.options.sort_ascending else 'descending'}"
+            "Final sort: %s %s",
+            self.options.sort_field.value,
+            "ascending" if self.options.sort_ascending else "descending",
         )
 
         # Re-run the search with new sort parameters
@@ -3531,19 +4545,29 @@ class ESTUI:
         """Execute search in a separate thread"""
         if not self.search_field.strip():
             self.status_message = "Enter a search term"
-            self.draw_interface()
+            self._invalidate()
             return
 
         self.options.query = self.search_field.strip()
         self.search_active = True
         self.status_message = "Searching..."
 
-        logging.debug(f"Starting search with query: '{self.options.query}'")
+        logging.debug("Starting search with query: '%s'", self.options.query)
         logging.debug(
-            f"Search options: mode={self.options.mode}, files_only={self.options.files_only}, folders_only={self.options.folders_only}"
+            "Search options: mode=%s, files_only=%s, folders_only=%s",
+            self.options.mode,
+            self.options.files_only,
+            self.options.folders_only,
         )
 
-        self.draw_interface()
+        self._invalidate()
+
+        # es.exe rows land here as they are parsed; the idle redraw in run()
+        # shows them while the search is still going
+        streamed: List[SearchResult] = []
+        self.results = streamed
+        self.current_result = 0
+        self.result_offset = 0
 
         # Execute search in thread to avoid blocking UI
         def search_thread():
@@ -3552,10 +4576,12 @@ class ESTUI:
                 start_time = time.time()
 
                 # Concatenate Everything (es.exe) results with Windows Search (es_winsearch.py) results
-                results, error = self.executor.execute_search_concat(self.options)
+                results, error = self.executor.execute_search_concat(
+                    self.options, streamed
+                )
 
                 elapsed_time = time.time() - start_time
-                logging.debug(f"Search completed in {elapsed_time:.3f} seconds")
+                logging.debug("Search completed in %.3f seconds", elapsed_time)
 
                 self.results = results
                 self.current_result = 0
@@ -3565,16 +4591,16 @@ class ESTUI:
 
                 if error:
                     self.status_message = f"Error: {error}"
-                    logging.error(f"Search error: {error}")
+                    logging.error("Search error: %s", error)
                 else:
                     self.status_message = f"Found {len(results)} results"
-                    logging.debug(f"Search successful: {len(results)} results")
+                    logging.debug("Search successful: %d results", len(results))
 
             except Exception as e:
                 self.search_active = False
                 self._ui_dirty = True
                 self.status_message = f"Search failed: {str(e)}"
-                logging.error(f"Search thread exception: {e}", exc_info=True)
+                logging.error("Search thread exception: %s", e, exc_info=True)
 
         threading.Thread(target=search_thread, daemon=True).start()
 
@@ -3583,42 +4609,43 @@ class ESTUI:
         if not self.debug_mode or not self.debug_log:
             return
 
+        # Snapshot: deques do not slice, and the view should not shift under us
+        log = list(self.debug_log)
         height, width = self.stdscr.getmaxyx()
-        dialog_height = min(len(self.debug_log) + 6, height - 2)
-        dialog_width = min(
-            max(80, max(len(line) for line in self.debug_log[-20:]) + 4), width - 4
-        )
+        dialog_height = min(len(log) + 6, height - 2)
+        dialog_width = min(max(80, self._debug_log_maxlen + 4), width - 4)
         start_y = (height - dialog_height) // 2
         start_x = (width - dialog_width) // 2
 
-        dialog_win = curses.newwin(dialog_height, dialog_width, start_y, start_x)
-        dialog_panel = panel.new_panel(dialog_win)
+        dialog_win = self._open_dialog(dialog_height, dialog_width, start_y, start_x)
 
-        scroll_pos = max(0, len(self.debug_log) - (dialog_height - 4))
+        visible_lines = dialog_height - 4
+        scroll_pos = max(0, len(log) - visible_lines)
+        last_scroll = None
 
         while True:
-            dialog_win.clear()
-            dialog_win.box()
+            # Keys that do not scroll leave the dialog as it is
+            if scroll_pos != last_scroll:
+                last_scroll = scroll_pos
+                dialog_win.erase()
+                dialog_win.box()
 
-            # Title
-            title = " Debug Log (F4 in debug mode) "
-            title_x = (dialog_width - len(title)) // 2
-            dialog_win.addstr(0, title_x, title, self.colors.HEADER)
+                # Title
+                title = " Debug Log (F4 in debug mode) "
+                title_x = (dialog_width - len(title)) // 2
+                dialog_win.addstr(0, title_x, title, self.colors.HEADER)
 
-            # Display debug messages
-            visible_lines = dialog_height - 4
-            for i, line in enumerate(
-                self.debug_log[scroll_pos : scroll_pos + visible_lines]
-            ):
-                y = i + 2
-                dialog_win.addstr(y, 2, line[: dialog_width - 4], self.colors.INFO)
+                # Display debug messages
+                for i, line in enumerate(log[scroll_pos : scroll_pos + visible_lines]):
+                    y = i + 2
+                    dialog_win.addstr(y, 2, line[: dialog_width - 4], self.colors.INFO)
 
-            # Instructions
-            instructions = "↑↓: Scroll | Esc: Close"
-            dialog_win.addstr(dialog_height - 2, 2, instructions)
+                # Instructions
+                instructions = "↑↓: Scroll | Esc: Close"
+                dialog_win.addstr(dialog_height - 2, 2, instructions)
 
-            panel.update_panels()
-            curses.doupdate()
+                panel.update_panels()
+                curses.doupdate()
 
             key = dialog_win.getch()
 
@@ -3627,12 +4654,10 @@ class ESTUI:
             elif key == curses.KEY_UP:
                 scroll_pos = max(0, scroll_pos - 1)
             elif key == curses.KEY_DOWN:
-                scroll_pos = min(len(self.debug_log) - visible_lines, scroll_pos + 1)
+                scroll_pos = min(len(log) - visible_lines, scroll_pos + 1)
 
-        del dialog_panel
-        del dialog_win
-        self.stdscr.clear()
-        self.draw_interface()
+        self._close_dialog()
+        self._invalidate()
 
     def show_options(self):
         try:
@@ -3644,13 +4669,18 @@ class ESTUI:
             logging.error("show_options(): fatal", exc_info=True)
             self.status_message = "Options error (see log)"
         finally:
-            self.draw_interface()
+            self._invalidate()
 
     def export_results(self):
         """Show export dialog and export results"""
         if not self.results:
             self.status_message = "No results to export"
-            self.draw_interface()
+            self._invalidate()
+            return
+
+        if self._export_in_flight:
+            self.status_message = "An export is already running"
+            self._invalidate()
             return
 
         export_dialog = ExportDialog(self.stdscr, self.results)
@@ -3658,16 +4688,31 @@ class ESTUI:
 
         if result:
             format_type, filename = result
-            success = self.executor.export_results(
-                self.results, format_type, filename, self.options
-            )
+            # A new search swaps in a new list, so this one stays intact
+            results = self.results
+            self._export_in_flight = True
+            self.status_message = f"Exporting {len(results)} results..."
 
-            if success:
-                self.status_message = f"Results exported to {filename}"
-            else:
-                self.status_message = f"Export failed"
+            # Writing thousands of rows must not stall the keyboard
+            def export_thread():
+                try:
+                    success = self.executor.export_results(
+                        results, format_type, filename, self.options
+                    )
+                    if success:
+                        self.status_message = f"Results exported to {filename}"
+                    else:
+                        self.status_message = f"Export failed"
+                except Exception as e:
+                    self.status_message = f"Export failed: {e}"
+                    logging.error("Export thread exception: %s", e, exc_info=True)
+                finally:
+                    self._export_in_flight = False
+                    self._ui_dirty = True
 
-        self.draw_interface()
+            threading.Thread(target=export_thread, daemon=True).start()
+
+        self._invalidate()
 
     def open_selected_result(self):
         """Open the currently selected result"""
@@ -3676,17 +4721,13 @@ class ESTUI:
 
         result = self.results[self.current_result]
 
-        try:
-            if os.name == "nt":  # Windows
-                os.startfile(result.full_path)
-            elif os.name == "posix":  # Unix/Linux/Mac
-                subprocess.run(["xdg-open", result.full_path])
-
+        # Returns as soon as the launcher is started; errors are logged there
+        if open_with_default_app(result.full_path):
             self.status_message = f"Opened: {result.filename}"
-        except Exception as e:
-            self.status_message = f"Failed to open: {str(e)}"
+        else:
+            self.status_message = f"Failed to open: {result.filename}"
 
-        self.draw_interface()
+        self._invalidate()
 
     def preview_selected_result(self):
         """Show preview dialog for selected result"""
@@ -3704,19 +4745,15 @@ class ESTUI:
 
         if result.size > 0:
             preview_text.append(f"Size: {self._format_size(result.size)}")
-
-        if result.date_modified:
-            preview_text.append(f"Modified: {result.date_modified}")
-
-        if result.date_created:
-            preview_text.append(f"Created: {result.date_created}")
-
-        if result.attributes:
-            preview_text.append(f"Attributes: {result.attributes}")
+        preview_text.extend(
+            f"{label}: {value}"
+            for label, value in zip(_PREVIEW_LABELS, _PREVIEW_FIELDS(result))
+            if value
+        )
 
         # Show simple preview dialog
         self._show_message_dialog("File Information", preview_text)
-        self.draw_interface()
+        self._invalidate()
 
     def _show_message_dialog(self, title: str, lines: List[str]):
         """Show a simple message dialog"""
@@ -3726,10 +4763,7 @@ class ESTUI:
         start_y = (height - dialog_height) // 2
         start_x = (width - dialog_width) // 2
 
-        dialog_win = curses.newwin(dialog_height, dialog_width, start_y, start_x)
-        dialog_panel = panel.new_panel(dialog_win)
-
-        dialog_win.clear()
+        dialog_win = self._open_dialog(dialog_height, dialog_width, start_y, start_x)
         dialog_win.box()
 
         # Title
@@ -3749,8 +4783,27 @@ class ESTUI:
 
         dialog_win.getch()  # Wait for key press
 
-        del dialog_panel
-        del dialog_win
+        self._close_dialog()
+
+    def _open_dialog(self, height: int, width: int, y: int, x: int):
+        """Size, place and raise the shared dialog window; returns it erased."""
+        win = self._dialog_win
+        try:
+            win.resize(height, width)
+            win.mvwin(y, x)
+        except curses.error:
+            # e.g. the terminal shrank under the old geometry: start afresh
+            win = self._dialog_win = curses.newwin(height, width, y, x)
+            self._dialog_panel.replace(win)
+        win.erase()
+        self._dialog_panel.show()
+        self._dialog_panel.top()
+        return win
+
+    def _close_dialog(self):
+        """Hide the shared dialog window; the next frame repaints beneath it."""
+        self._dialog_panel.hide()
+        self.stdscr.touchwin()
 
     def open_selected(self):
         """Open the currently highlighted search result with the default app."""
@@ -3784,8 +4837,7 @@ class ESTUI:
             self.status_message = "Open failed (see log)"
         finally:
             # Ensure UI refreshes even if no key was pressed after Enter
-            self._ui_dirty = True
-            self.draw_interface()
+            self._invalidate()
 
 
 def main():
@@ -3841,10 +4893,22 @@ def main():
         sh = logging.StreamHandler()
 
         class _AsciiSafeFilter(logging.Filter):
+            def __init__(self, encoding: Optional[str]):
+                super().__init__()
+                self._enc = encoding or "utf-8"
+                try:
+                    # A UTF-8 console takes every message as is
+                    self._safe = codecs.lookup(self._enc).name == "utf-8"
+                except LookupError:
+                    self._safe = False
+
             def filter(self, record: logging.LogRecord) -> bool:
+                if self._safe:
+                    return True
                 try:
-                    (sys.stdout.encoding or "utf-8")
-                    record.getMessage().encode(sys.stdout.encoding or "utf-8")
+                    msg = record.getMessage()
+                    if not msg.isascii():
+                        msg.encode(self._enc)
                     return True
                 except Exception:
                     # Fallback: replace non-encodables so we never crash the console
@@ -3856,7 +4920,7 @@ def main():
                     record.args = ()
                     return True
 
-        sh.addFilter(_AsciiSafeFilter())
+        sh.addFilter(_AsciiSafeFilter(getattr(sh.stream, "encoding", None)))
         handlers.append(sh)
 
     logging.basicConfig(
@@ -3916,15 +4980,10 @@ def main():
             # Re-raise the exception so it appears in the terminal after curses cleanup
             raise
 
-    # Verify ES executable exists
-    def find_executable(name):
-        """Find executable in PATH"""
-        import shutil
-
-        return shutil.which(name) is not None
-
+    # Verify ES executable exists; the stat of the current directory is
+    # cheaper than a PATH walk, so it goes first
     if args.es_path == "es.exe":
-        if not find_executable("es.exe") and not os.path.isfile("es.exe"):
+        if not os.path.isfile("es.exe") and shutil.which("es.exe") is None:
             print(f"Warning: es.exe not found in PATH or current directory.")
             print(
                 "Make sure es.exe is in your PATH or specify the correct path with --es-path"
@@ -3948,6 +5007,10 @@ def main():
 
 
 # ---------- safer screen write ----------
+# Terminal encoding, read once; curses does not swap sys.stdout underneath us
+_STDOUT_ENC = getattr(sys.stdout, "encoding", None) or "utf-8"
+
+
 def safe_addstr(win, y, x, text, attr=0):
     """Write within bounds with detailed error logging."""
     try:
@@ -3965,13 +5028,15 @@ def safe_addstr(win, y, x, text, attr=0):
             return
 
         display_text = str(text)[:maxlen]
-        try:
-            display_text.encode(sys.stdout.encoding or "utf-8", errors="replace")
-        except Exception as enc_e:
-            logging.debug(f"safe_addstr: Encoding failed for {repr(text)}: {enc_e}")
-            display_text = (
-                str(text)[:maxlen].encode("ascii", errors="replace").decode("ascii")
-            )
+        # Plain ASCII always encodes; only probe the terminal codec otherwise
+        if not display_text.isascii():
+            try:
+                display_text.encode(_STDOUT_ENC, errors="replace")
+            except Exception as enc_e:
+                logging.debug(f"safe_addstr: Encoding failed for {repr(text)}: {enc_e}")
+                display_text = display_text.encode("ascii", errors="replace").decode(
+                    "ascii"
+                )
 
         win.addstr(y, x, display_text, attr)
 
@@ -3980,7 +5045,8 @@ def safe_addstr(win, y, x, text, attr=0):
         try:
             # last-ditch: strip zero-width/FEFF and write without attrs
             fallback = str(text)[:maxlen].replace("\u200b", "").replace("\ufeff", "")
-            win.addstr(y, x, fallback)
+            fallback = fallback.encode("ascii", "backslashreplace").decode("ascii")
+            win.addstr(y, x, fallback[:maxlen])
         except Exception:
             pass
 
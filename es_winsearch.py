@@ -77,6 +77,25 @@ def size_fmt(n: Optional[int], mode: int) -> str:
         return f"{n/1024/1024/1024:.2f} GB"
 
 
+# FILE_ATTRIBUTE_* bits in the order es.exe prints their letters
+_ATTRIB_LETTERS = (
+    (0x1, "R"),
+    (0x2, "H"),
+    (0x4, "S"),
+    (0x10, "D"),
+    (0x20, "A"),
+)
+
+
+def attrib_fmt(bits: Optional[int]) -> str:
+    """Render System.FileAttributes as es.exe-style letters (e.g. "DA")."""
+    try:
+        bits = int(bits or 0)
+    except (ValueError, TypeError):
+        return ""
+    return "".join(letter for mask, letter in _ATTRIB_LETTERS if bits & mask)
+
+
 def to_file_uri(path: str) -> str:
     # Windows Search expects scope like: file:C:\Path\
     path = os.path.abspath(path)
@@ -360,6 +379,7 @@ def gather_results(opts: Dict[str, Any], search_terms: List[str]):
         "System.DateCreated": "dc",
         "System.DateModified": "dm",
         "System.DateAccessed": "da",
+        "System.FileAttributes": "attrib_bits",
     }
 
     # Determine which columns to *output*
@@ -451,8 +471,10 @@ def gather_results(opts: Dict[str, Any], search_terms: List[str]):
         except Exception:
             pass
 
-    # Build "full" column if requested
+    # Build "full" column if requested; render attributes like es.exe so the
+    # TUI can tell folders apart without touching the filesystem
     for r in rows:
+        r["attributes"] = attrib_fmt(r.get("attrib_bits"))
         path = r.get("path") or ""
         name = r.get("name") or ""
         if path and name and path.endswith("\\"):